@@ -1,15 +1,56 @@
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for
+from flask import Flask, render_template, request, jsonify, session, redirect, url_for, g
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import HTTPException
 from config import Config
 from course_manager import CourseManager
 from tutorial_manager import TutorialManager
 from branch_selector import BranchSelector
 from github_integration import GitHubIntegration
+from cache_service import cache
+from language_index import LanguageIndex
+from rate_limiter import RateLimiter
+import hashlib
 import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
 from pathlib import Path
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster (de)serialization"""
+
+    # The frontend doesn't depend on key order, so skip the sort
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build a jsonify response from orjson bytes without a str round trip"""
+        obj = self._prepare_response_obj(args, kwargs)
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=option),
+            mimetype=self.mimetype
+        )
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 app.config.from_object(Config)
 
 # Load saved configuration at startup
@@ -23,57 +64,295 @@ if saved_config:
         os.environ['GITHUB_TOKEN'] = saved_config['github_token']
     if 'default_branch' in saved_config:
         Config.DEFAULT_BRANCH = saved_config['default_branch']
-    # Reload languages with the loaded config
-    Config.reload_languages()
+
+# Constant parts of issue labels/project fields
+COURSE_BASE_LABELS = ("content - course", "content proofreading")
+COURSE_QUIZ_LABEL = "content - quiz"
+# Quiz label goes right after "content - course"
+COURSE_WITH_QUIZ_LABELS = (COURSE_BASE_LABELS[0], COURSE_QUIZ_LABEL, COURSE_BASE_LABELS[1])
+TUTORIAL_BASE_LABELS = ("content - tutorial", "content proofreading")
+WEBLATE_LABEL = "website translation"
+VIDEO_COURSE_LABEL = "video transcript"
+IMAGE_COURSE_LABEL = "content - images"
+IMAGE_COURSE_BASE_LABELS = (COURSE_BASE_LABELS[0], IMAGE_COURSE_LABEL)
+
+# Base URL of the content repository on GitHub, for issue body links
+CONTENT_REPO_URL = f"https://github.com/{Config.GITHUB_OWNER}/{Config.GITHUB_REPO}"
+
+# Pre-built "language - xx" labels for the known languages
+LANGUAGE_LABELS = {code: f"language - {code}" for code in Config.get_languages()}
+
+def language_label(lang):
+    """Get the issue label for a language code"""
+    return LANGUAGE_LABELS.get(lang) or f"language - {lang}"
+
+# TTL for cached repository listings/course info (seconds)
+REPO_CACHE_TTL = 120
+
+# TTL for branch search results (seconds)
+BRANCH_SEARCH_CACHE_TTL = 30
+
+# TTL for built issue payloads, so create can reuse a preview (seconds)
+ISSUE_PAYLOAD_CACHE_TTL = 30
+
+# Pooled HTTP session for outbound (Weblate) API calls
+http_session = requests.Session()
+_http_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10,
+                            max_retries=Retry(total=3, backoff_factor=0.3))
+http_session.mount('http://', _http_adapter)
+http_session.mount('https://', _http_adapter)
+http_session.headers.update({
+    'User-Agent': 'proofreading-issue-manager/1.0',
+    'Accept': 'application/json'
+})
+
+# Weblate language list; the API is paginated, so ask for large pages
+WEBLATE_LANGUAGES_URL = 'https://weblate.planb.network/api/languages/?page_size=1000'
 
 # Cache for Weblate languages
 weblate_languages_cache = {
     'data': None,
     'last_updated': None,
-    'ttl': timedelta(hours=24)  # Cache for 24 hours
+    'ttl': timedelta(hours=24),  # Cache for 24 hours
+    'failed_at': None,
+    'retry_after': timedelta(minutes=5)  # Wait before retrying a failed fetch
+}
+_weblate_refresh_lock = threading.Lock()
+
+# Instances are cached per token/repo path so that connection pools and
+# in-memory caches (e.g. branch lists) survive across requests
+INSTANCE_CACHE_SIZE = 8
+
+def _cached_instance(factory):
+    """Cache a factory's instances by arguments, building each under a lock
+
+    Hits don't lock at all; misses take a lock private to this factory, so
+    concurrent misses don't construct duplicates (GitHubIntegration hits
+    the network on construction) and a slow build of one kind doesn't
+    stall requests for the others.
+    """
+    instances = {}
+    lock = threading.Lock()
+    
+    def get_instance(*args):
+        instance = instances.get(args)
+        if instance is None:
+            with lock:
+                instance = instances.get(args)
+                if instance is None:
+                    instance = factory(*args)
+                    if len(instances) >= INSTANCE_CACHE_SIZE:
+                        # Drop the oldest instance
+                        instances.pop(next(iter(instances)))
+                    instances[args] = instance
+        return instance
+    
+    def cache_clear():
+        with lock:
+            instances.clear()
+    
+    get_instance.cache_clear = cache_clear
+    return get_instance
+
+@_cached_instance
+def _cached_github_integration(token):
+    return GitHubIntegration(token)
+
+@_cached_instance
+def _cached_branch_selector(token, repo_path):
+    return BranchSelector(token, repo_path)
+
+@_cached_instance
+def _cached_course_manager(repo_path):
+    return CourseManager(repo_path)
+
+@_cached_instance
+def _cached_tutorial_manager(repo_path):
+    return TutorialManager(repo_path)
+
+def clear_instance_caches():
+    """Drop cached integrations/managers - call when the configuration changes"""
+    _cached_github_integration.cache_clear()
+    _cached_branch_selector.cache_clear()
+    _cached_course_manager.cache_clear()
+    _cached_tutorial_manager.cache_clear()
+
+# Issue form endpoints, and whether they need a repo path as well as a token
+FORM_ENDPOINTS = {
+    'new_course_issue': True,
+    'new_tutorial_issue': True,
+    'new_tutorial_section_issue': True,
+    'new_weblate_issue': False,
+    'new_video_course_issue': True,
+    'new_quiz_issue': True,
+    'new_image_course_issue': True,
 }
 
+@app.before_request
+def resolve_configuration():
+    """Resolve the effective token and repo path once per request
+
+    Issue forms that need configuration the user hasn't provided yet are
+    redirected to the config page here rather than in each view.
+    """
+    if request.endpoint == 'static':
+        return
+    g.github_token = Config.GITHUB_TOKEN or session.get('github_token')
+    g.repo_path = Config.BITCOIN_CONTENT_REPO_PATH or session.get('repo_path')
+    
+    needs_repo = FORM_ENDPOINTS.get(request.endpoint)
+    if needs_repo is not None:
+        if not g.github_token or (needs_repo and not g.repo_path):
+            return redirect_to_config()
+
 def get_github_integration():
     """Get GitHub integration instance"""
-    token = Config.GITHUB_TOKEN or session.get('github_token')
-    if not token:
+    if not g.github_token:
         return None
-    return GitHubIntegration(token)
+    return _cached_github_integration(g.github_token)
 
 def get_branch_selector():
     """Get branch selector instance"""
-    token = Config.GITHUB_TOKEN or session.get('github_token')
-    if not token:
+    if not g.github_token:
         return None
-    repo_path = Config.BITCOIN_CONTENT_REPO_PATH or session.get('repo_path')
-    return BranchSelector(token, repo_path)
+    return _cached_branch_selector(g.github_token, g.repo_path)
 
 def get_course_manager():
     """Get course manager instance"""
-    repo_path = Config.BITCOIN_CONTENT_REPO_PATH or session.get('repo_path')
-    if not repo_path:
+    if not g.repo_path:
         return None
-    return CourseManager(repo_path)
+    return _cached_course_manager(g.repo_path)
 
 def get_tutorial_manager():
     """Get tutorial manager instance"""
-    repo_path = Config.BITCOIN_CONTENT_REPO_PATH or session.get('repo_path')
-    if not repo_path:
+    if not g.repo_path:
         return None
-    return TutorialManager(repo_path)
+    return _cached_tutorial_manager(g.repo_path)
+
+# Required JSON fields for course issue preview/create requests
+COURSE_ISSUE_FIELDS = ('course_id', 'language', 'branch', 'iteration', 'urgency')
+
+def parse_json_body(required_fields=()):
+    """Parse the JSON request body and check required fields
+
+    Returns (data, None) on success or (None, error_response) when the body
+    is not a JSON object or a required field is missing/empty.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return None, (jsonify({'error': 'Request body must be a JSON object'}), 400)
+    
+    missing = [field for field in required_fields if not data.get(field)]
+    if missing:
+        return None, (jsonify({'error': f"Missing required fields: {', '.join(missing)}"}), 400)
+    
+    return data, None
+
+@app.errorhandler(FileNotFoundError)
+def handle_not_found(e):
+    """Missing course/tutorial files are reported as 404s"""
+    return jsonify({'error': str(e)}), 404
+
+@app.errorhandler(ValueError)
+def handle_bad_metadata(e):
+    """A course.yml/tutorial.yml without its id is as unusable as a missing one"""
+    if not request.path.startswith('/api/'):
+        return handle_exception(e)
+    return jsonify({'error': str(e)}), 404
+
+@app.errorhandler(413)
+def handle_too_large(e):
+    """Bodies over MAX_CONTENT_LENGTH are rejected before parsing"""
+    return jsonify({'error': 'Request body too large'}), 413
+
+# Non-API endpoints whose callers expect JSON errors
+JSON_ERROR_ENDPOINTS = {'preview_issue', 'create_issue'}
+
+def wants_json_error():
+    """Whether errors for the current request are reported as JSON"""
+    return request.path.startswith('/api/') or request.endpoint in JSON_ERROR_ENDPOINTS
+
+@app.errorhandler(Exception)
+def handle_exception(e):
+    """Log unexpected errors and report them to API callers as JSON
+
+    Form pages, and every request in debug mode, re-raise so Flask logs
+    them and shows its own 500 page (or the Werkzeug debugger).
+    """
+    if isinstance(e, HTTPException):
+        return e
+    if app.debug or not wants_json_error():
+        raise e
+    app.logger.exception("Unhandled error on %s", request.path)
+    return jsonify({'error': str(e)}), 500
+
+# Built on first use; the URL map doesn't change after startup
+_config_url = None
+
+def redirect_to_config():
+    """Redirect to the configuration page"""
+    global _config_url
+    if _config_url is None:
+        _config_url = url_for('config')
+    return redirect(_config_url)
+
+# Browser cache lifetime for repository listings (seconds); the ETag lets
+# the browser revalidate cheaply after that
+REPO_LISTING_MAX_AGE = 10
+
+def conditional_response(max_age):
+    """Tag successful responses with a content ETag and Cache-Control
+
+    A matching If-None-Match gets an empty 304. Responses are private since
+    they depend on the repo path configured for the session.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            response = app.make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+            response.set_etag(hashlib.blake2b(response.get_data(), digest_size=8).hexdigest())
+            response.cache_control.private = True
+            response.cache_control.max_age = max_age
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
+
+# Requests that have to go to the GitHub API are limited per client so a
+# burst of autocomplete requests can't exhaust the token's hourly quota.
+# Answers from the local clone or a cache don't count.
+github_rate_limiter = RateLimiter(limit=120, window_seconds=60)
+
+def rate_limit_response(limiter):
+    """Count this request against limiter; a 429 response if over its rate"""
+    retry_after = limiter.hit(request.remote_addr)
+    if not retry_after:
+        return None
+    response = jsonify({'error': 'Too many requests, please slow down'})
+    response.status_code = 429
+    response.headers['Retry-After'] = str(int(retry_after) + 1)
+    return response
+
+def render_issue_form(template):
+    """Render an issue form with the languages and default branch"""
+    return render_template(template,
+                           languages=Config.get_languages(),
+                           default_branch=Config.DEFAULT_BRANCH or session.get('default_branch', 'dev'))
 
 @app.route('/')
 def index():
     """Landing page"""
     # Check if configuration is complete
-    config_complete = bool(Config.GITHUB_TOKEN and Config.BITCOIN_CONTENT_REPO_PATH)
+    config_complete = bool(g.github_token and g.repo_path)
     return render_template('index.html', config_complete=config_complete)
 
 @app.route('/config', methods=['GET', 'POST'])
 def config():
     """Configuration page"""
     if request.method == 'POST':
-        data = request.get_json()
+        # A missing/invalid body falls through to the repo path validation below
+        data = request.get_json(silent=True) or {}
         
         # Validate repo path
         repo_path = data.get('repo_path', '')
@@ -98,8 +377,13 @@ def config():
         Config.GITHUB_TOKEN = github_token
         Config.DEFAULT_BRANCH = data.get('default_branch', 'dev')
         
-        # Reload languages from the new repo path
+        # Reload languages from the new repo path and rebuild their index now
         Config.reload_languages()
+        get_config_language_index()
+        
+        # Token or repo path may have changed
+        clear_instance_caches()
+        cache.clear()
         
         # Save configuration
         config_data = {
@@ -108,10 +392,11 @@ def config():
             'default_branch': data.get('default_branch', 'dev')
         }
         
-        # Save to session
-        session['repo_path'] = repo_path
-        session['github_token'] = github_token
-        session['default_branch'] = data.get('default_branch', 'dev')
+        # Everything lives server-side (Config + user_config.json); drop
+        # values older versions stored in the cookie. Nothing new is written,
+        # so the session cookie isn't re-sent unless it held one of these.
+        for key in ('repo_path', 'github_token', 'default_branch'):
+            session.pop(key, None)
         
         # Optionally save to file
         Config.save_config(config_data)
@@ -125,42 +410,29 @@ def config():
 @app.route('/course/new')
 def new_course_issue():
     """Course issue creation form"""
-    # Check configuration
-    if not (Config.GITHUB_TOKEN or session.get('github_token')):
-        return redirect(url_for('config'))
-    
-    if not (Config.BITCOIN_CONTENT_REPO_PATH or session.get('repo_path')):
-        return redirect(url_for('config'))
-    
-    return render_template('course_form.html', 
-                         languages=Config.LANGUAGES,
-                         default_branch=Config.DEFAULT_BRANCH or session.get('default_branch', 'dev'))
+    return render_issue_form('course_form.html')
 
 @app.route('/api/courses')
+@conditional_response(REPO_LISTING_MAX_AGE)
 def api_courses():
     """API endpoint to get list of courses"""
     manager = get_course_manager()
     if not manager:
         return jsonify({'error': 'Repository path not configured'}), 400
     
-    try:
-        courses = manager.get_course_list()
-        return jsonify({'courses': courses})
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    courses = cache.get_or_set(('courses', str(manager.repo_path)),
+                               manager.get_course_list, REPO_CACHE_TTL)
+    return jsonify({'courses': courses})
 
 @app.route('/api/course/<course_id>')
+@conditional_response(REPO_LISTING_MAX_AGE)
 def api_course_info(course_id):
     """API endpoint to get course information"""
     manager = get_course_manager()
     if not manager:
         return jsonify({'error': 'Repository path not configured'}), 400
     
-    try:
-        course_info = manager.get_course_info(course_id)
-        return jsonify(course_info)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 404
+    return jsonify(get_course_info(manager, course_id))
 
 @app.route('/api/branches/search')
 def api_branch_search():
@@ -172,12 +444,18 @@ def api_branch_search():
     if not selector:
         return jsonify({'error': 'GitHub token not configured'}), 400
     
-    try:
+    # Typing in the branch field fires a search per keystroke
+    cache_key = ('branch_search', str(selector.local_repo_path), query, language)
+    branches = cache.get(cache_key)
+    if branches is None:
+        if selector.remote_fetch_due():
+            limited = rate_limit_response(github_rate_limiter)
+            if limited:
+                return limited
         context = {'language': language} if language else None
         branches = selector.fuzzy_search(query, context=context)
-        return jsonify({'branches': branches})
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        cache.set(cache_key, branches, BRANCH_SEARCH_CACHE_TTL)
+    return jsonify({'branches': branches})
 
 @app.route('/api/branches/validate/<branch_name>')
 def api_validate_branch(branch_name):
@@ -186,307 +464,389 @@ def api_validate_branch(branch_name):
     if not selector:
         return jsonify({'error': 'GitHub token not configured'}), 400
     
-    try:
-        exists = selector.branch_exists(branch_name)
-        return jsonify({'exists': exists})
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    if selector.remote_lookup_needed([branch_name]):
+        limited = rate_limit_response(github_rate_limiter)
+        if limited:
+            return limited
+    
+    exists = selector.branch_exists(branch_name)
+    return jsonify({'exists': exists})
+
+# Upper bound on names per /api/branches/validate request
+MAX_VALIDATE_BRANCHES = 50
+
+@app.route('/api/branches/validate', methods=['POST'])
+def api_validate_branches():
+    """API endpoint to validate several branches in one request"""
+    data, error = parse_json_body()
+    if error:
+        return error
+    branch_names = data.get('branches')
+    if not isinstance(branch_names, list) or not all(isinstance(name, str) for name in branch_names):
+        return jsonify({'error': "'branches' must be a list of branch names"}), 400
+    # Each name becomes an alias in one GraphQL query, so keep it small
+    if len(branch_names) > MAX_VALIDATE_BRANCHES:
+        return jsonify({'error': f"At most {MAX_VALIDATE_BRANCHES} branches can be validated at once"}), 400
+    
+    selector = get_branch_selector()
+    if not selector:
+        return jsonify({'error': 'GitHub token not configured'}), 400
+    
+    if selector.remote_lookup_needed(branch_names):
+        limited = rate_limit_response(github_rate_limiter)
+        if limited:
+            return limited
+    
+    return jsonify({'branches': selector.branches_exist(branch_names)})
+
+# Browser cache lifetimes for language responses (seconds). Config languages
+# can change when the repo path is saved, so they are revalidated sooner.
+CONFIG_LANGUAGES_MAX_AGE = 300
+WEBLATE_LANGUAGES_MAX_AGE = 3600
+
+def language_response(index, body, max_age):
+    """JSON response tagged with the language index's ETag (304 on a match)"""
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(index.etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
+
+# Index over Config.LANGUAGES, rebuilt whenever get_languages() re-reads the file
+# (built at import so the first keystroke doesn't pay for it)
+_config_language_index = {'source': Config.get_languages(), 'index': LanguageIndex(Config.get_languages().items())}
+
+def get_config_language_index():
+    """Get the LanguageIndex for Config.LANGUAGES"""
+    languages = Config.get_languages()
+    if _config_language_index['source'] is not languages:
+        _config_language_index['index'] = LanguageIndex(languages.items())
+        _config_language_index['source'] = languages
+    return _config_language_index['index']
 
 @app.route('/api/languages/search')
 def api_language_search():
     """API endpoint for language fuzzy search"""
-    query = request.args.get('q', '').lower()
-    
-    # Convert language dict to searchable format
-    languages = []
-    for code, name in Config.LANGUAGES.items():
-        languages.append({
-            'code': code,
-            'name': name,
-            'display': f"{name} ({code})",
-            'searchText': f"{name.lower()} {code.lower()}"
-        })
+    index = get_config_language_index()
+    query = request.args.get('q', '')
+    return language_response(index, index.search_payload(query), CONFIG_LANGUAGES_MAX_AGE)
+
+def _weblate_cache_is_fresh():
+    return (weblate_languages_cache['data'] is not None and 
+            weblate_languages_cache['last_updated'] is not None and
+            datetime.now() - weblate_languages_cache['last_updated'] < weblate_languages_cache['ttl'])
+
+def _weblate_recently_failed():
+    failed_at = weblate_languages_cache['failed_at']
+    return (failed_at is not None and
+            datetime.now() - failed_at < weblate_languages_cache['retry_after'])
+
+def _weblate_snapshot_path():
+    return Path(Config.CACHE_DIR) / 'weblate-languages.json'
+
+def _load_weblate_snapshot():
+    """Seed the Weblate cache from the on-disk snapshot, if there is one
+
+    The snapshot's mtime counts as its last update, so an old snapshot is
+    served as stale data while a refresh is fetched.
+    """
+    snapshot_path = _weblate_snapshot_path()
+    try:
+        pairs = orjson.loads(snapshot_path.read_bytes())
+        last_updated = datetime.fromtimestamp(snapshot_path.stat().st_mtime)
+    except FileNotFoundError:
+        return
+    except (OSError, orjson.JSONDecodeError) as e:
+        print(f"Error reading Weblate language snapshot: {e}")
+        return
+    
+    weblate_languages_cache['data'] = LanguageIndex(pairs)
+    weblate_languages_cache['last_updated'] = last_updated
+
+def _write_weblate_snapshot(pairs):
+    """Atomically write the (code, name) pairs fetched from Weblate"""
+    snapshot_path = _weblate_snapshot_path()
+    try:
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = snapshot_path.with_suffix('.tmp')
+        tmp_path.write_bytes(orjson.dumps(pairs))
+        os.replace(tmp_path, snapshot_path)
+    except OSError as e:
+        print(f"Error writing Weblate language snapshot: {e}")
+
+def _weblate_fallback(stale):
+    """Serve the stale Weblate list, or config languages if there is none"""
+    if stale is not None:
+        return stale, 'stale'
+    return get_config_language_index(), 'fallback'
+
+def _fetch_weblate_languages():
+    """Fetch the Weblate language list and store it in the cache
+
+    Callers must hold _weblate_refresh_lock. Failures are recorded in
+    failed_at and re-raised.
+    """
+    try:
+        # Fetch languages from Weblate API, following its pagination over the
+        # pooled session
+        pairs = []
+        url = WEBLATE_LANGUAGES_URL
+        while url:
+            with http_session.get(url, timeout=10) as response:
+                response.raise_for_status()
+                # orjson parses the raw bytes directly; the body is released on exit
+                page = orjson.loads(response.content)
+            pairs.extend((lang.get('code', ''), lang.get('name', '')) for lang in page.get('results', []))
+            url = page.get('next')
+    except Exception:
+        weblate_languages_cache['failed_at'] = datetime.now()
+        raise
+    
+    index = LanguageIndex(pairs)
+    
+    # Update cache
+    weblate_languages_cache['data'] = index
+    weblate_languages_cache['last_updated'] = datetime.now()
+    weblate_languages_cache['failed_at'] = None
+    _write_weblate_snapshot(pairs)
+    return index
+
+def _weblate_refresh_loop():
+    """Refresh the Weblate list every half TTL so requests never wait on it"""
+    interval = weblate_languages_cache['ttl'].total_seconds() / 2
+    backoff = 60
+    while True:
+        # Sleep until the current list is half a TTL old (a request may have
+        # refreshed it in the meantime)
+        last_updated = weblate_languages_cache['last_updated']
+        if last_updated is not None and weblate_languages_cache['failed_at'] is None:
+            age = (datetime.now() - last_updated).total_seconds()
+            if age < interval:
+                time.sleep(interval - age)
+                continue
+        
+        with _weblate_refresh_lock:
+            # A request refreshed the list while we waited for the lock
+            if (weblate_languages_cache['failed_at'] is None and
+                    weblate_languages_cache['last_updated'] is not last_updated):
+                continue
+            try:
+                _fetch_weblate_languages()
+                backoff = 60
+                continue
+            except Exception as e:
+                print(f"Error refreshing Weblate languages: {e}")
+        
+        # Back off exponentially, up to the normal interval
+        time.sleep(backoff)
+        backoff = min(backoff * 2, interval)
+
+_weblate_refresher = None
+_weblate_refresher_lock = threading.Lock()
+
+def _ensure_weblate_refresher():
+    """Start the background refresher on first use (not at import time)"""
+    global _weblate_refresher
+    if _weblate_refresher is None:
+        with _weblate_refresher_lock:
+            if _weblate_refresher is None:
+                _weblate_refresher = threading.Thread(
+                    target=_weblate_refresh_loop, name='weblate-refresh', daemon=True
+                )
+                _weblate_refresher.start()
+
+def get_weblate_language_index():
+    """Get the LanguageIndex for Weblate languages, from the cache or the Weblate API
+
+    Returns (index, cache_status) where cache_status is 'hit', 'miss'
+    (freshly fetched), 'stale' or 'fallback' (Config.LANGUAGES).
+    """
+    # After a restart, start from the list saved by the previous process
+    if weblate_languages_cache['data'] is None:
+        _load_weblate_snapshot()
+    _ensure_weblate_refresher()
     
-    if not query:
-        return jsonify({'languages': languages[:10]})  # Return first 10 if no query
+    # Check if cache is still valid
+    if _weblate_cache_is_fresh():
+        return weblate_languages_cache['data'], 'hit'
     
-    # Simple fuzzy matching
-    results = []
-    for lang in languages:
-        # Check if query matches in name or code
-        if query in lang['searchText']:
-            # Calculate a simple relevance score
-            score = 0
-            if lang['code'].lower() == query:
-                score = 100  # Exact code match
-            elif lang['code'].lower().startswith(query):
-                score = 90   # Code starts with query
-            elif lang['name'].lower().startswith(query):
-                score = 80   # Name starts with query
-            elif query in lang['name'].lower():
-                score = 70   # Query in name
-            else:
-                score = 60   # Query in code
-            
-            results.append((lang, score))
+    # The refresher normally keeps the cache fresh; this path only runs
+    # before its first fetch finishes or after failures
+    stale = weblate_languages_cache['data']
     
-    # Sort by score and return top results
-    results.sort(key=lambda x: x[1], reverse=True)
-    return jsonify({'languages': [r[0] for r in results[:10]]})
-
-@app.route('/api/weblate/languages')
-def api_weblate_languages():
-    """API endpoint for Weblate languages with caching"""
-    global weblate_languages_cache
+    # After a failed fetch, serve the fallback directly for a while instead
+    # of making every keystroke wait on another attempt
+    if _weblate_recently_failed():
+        return _weblate_fallback(stale)
     
-    # Check if cache is still valid
-    if (weblate_languages_cache['data'] is not None and 
-        weblate_languages_cache['last_updated'] is not None and
-        datetime.now() - weblate_languages_cache['last_updated'] < weblate_languages_cache['ttl']):
-        return jsonify({'languages': weblate_languages_cache['data']})
+    # Only one request refreshes at a time; the others keep serving the stale
+    # list, and only wait when there is nothing cached yet
+    if not _weblate_refresh_lock.acquire(blocking=stale is None):
+        return stale, 'stale'
     
     try:
-        # Fetch languages from Weblate API
-        response = requests.get('https://weblate.planb.network/api/languages/', timeout=10)
-        response.raise_for_status()
-        
-        weblate_data = response.json()
-        languages = []
-        
-        # Process the results
-        results = weblate_data.get('results', [])
-        for lang in results:
-            # Extract language info
-            languages.append({
-                'code': lang.get('code', ''),
-                'name': lang.get('name', ''),
-                'display': f"{lang.get('name', '')} ({lang.get('code', '')})",
-                'searchText': f"{lang.get('name', '').lower()} {lang.get('code', '').lower()}"
-            })
-        
-        # Update cache
-        weblate_languages_cache['data'] = languages
-        weblate_languages_cache['last_updated'] = datetime.now()
-        
-        return jsonify({'languages': languages})
+        # Another request may have refreshed (or failed) while we waited for
+        # the lock
+        if _weblate_cache_is_fresh():
+            return weblate_languages_cache['data'], 'hit'
+        if _weblate_recently_failed():
+            return _weblate_fallback(stale)
+        
+        return _fetch_weblate_languages(), 'miss'
     except Exception as e:
-        # Fallback to config languages if Weblate API fails
+        # Fall back to the stale list, or config languages if there is none
         print(f"Error fetching Weblate languages: {e}")
-        languages = []
-        for code, name in Config.LANGUAGES.items():
-            languages.append({
-                'code': code,
-                'name': name,
-                'display': f"{name} ({code})",
-                'searchText': f"{name.lower()} {code.lower()}"
-            })
-        return jsonify({'languages': languages})
+        return _weblate_fallback(stale)
+    finally:
+        _weblate_refresh_lock.release()
+
+def weblate_language_response(index, body, cache_status):
+    """Language response with an X-Cache header for the Weblate cache state"""
+    # Stale/fallback lists are replaced once Weblate answers again, so the
+    # browser shouldn't hold on to them for long
+    if cache_status in ('hit', 'miss'):
+        max_age = WEBLATE_LANGUAGES_MAX_AGE
+    else:
+        max_age = CONFIG_LANGUAGES_MAX_AGE
+    response = language_response(index, body, max_age)
+    response.headers['X-Cache'] = cache_status
+    return response
+
+@app.route('/api/weblate/languages')
+def api_weblate_languages():
+    """API endpoint for Weblate languages with caching"""
+    index, cache_status = get_weblate_language_index()
+    return weblate_language_response(index, index.all_payload, cache_status)
 
 @app.route('/api/weblate/languages/search')
 def api_weblate_language_search():
     """API endpoint for Weblate language fuzzy search"""
-    query = request.args.get('q', '').lower()
-    
-    # First get all languages (from cache or API)
-    response = api_weblate_languages()
-    all_languages = response.get_json()['languages']
-    
-    if not query:
-        return jsonify({'languages': all_languages[:10]})  # Return first 10 if no query
-    
-    # Simple fuzzy matching
-    results = []
-    for lang in all_languages:
-        # Check if query matches in name or code
-        if query in lang['searchText']:
-            # Calculate a simple relevance score
-            score = 0
-            if lang['code'].lower() == query:
-                score = 100  # Exact code match
-            elif lang['code'].lower().startswith(query):
-                score = 90   # Code starts with query
-            elif lang['name'].lower().startswith(query):
-                score = 80   # Name starts with query
-            elif query in lang['name'].lower():
-                score = 70   # Query in name
-            else:
-                score = 60   # Query in code
-            
-            results.append((lang, score))
-    
-    # Sort by score and return top results
-    results.sort(key=lambda x: x[1], reverse=True)
-    return jsonify({'languages': [r[0] for r in results[:10]]})
+    index, cache_status = get_weblate_language_index()
+    query = request.args.get('q', '')
+    return weblate_language_response(index, index.search_payload(query), cache_status)
 
-@app.route('/course/preview', methods=['POST'])
-def preview_course_issue():
-    """Preview the issue before creation"""
-    data = request.get_json()
+def build_github_versions_body(pbn_url, github_urls):
+    """Build the "PBN version" + "github version" issue body lines"""
+    # github_urls already lists EN first, followed by the target language
+    return f"en PBN version: {pbn_url}\n" + '\n'.join(
+        f"{lang} github version: {url}" for lang, url in github_urls
+    )
 
-    manager = get_course_manager()
-    if not manager:
-        return jsonify({'error': 'Repository path not configured'}), 400
+def get_course_info(manager, course_id):
+    """Get course info, cached per repo path and course"""
+    return cache.get_or_set(('course_info', str(manager.repo_path), course_id),
+                            lambda: manager.get_course_info(course_id), REPO_CACHE_TTL)
 
-    try:
-        # Get course info
-        course_info = manager.get_course_info(data['course_id'])
-
-        # Build URLs
-        pbn_url = manager.build_pbn_url(course_info['title'], course_info['uuid'], data['language'])
-        github_urls = manager.build_github_urls(data['course_id'], data['language'], data['branch'])
-
-        # Build issue title
-        if data.get('include_quiz'):
-            title = f"[PROOFREADING] {data['course_id']} + quiz - {data['language']}"
-        else:
-            title = f"[PROOFREADING] {data['course_id']} - {data['language']}"
-
-        # Build issue body
-        body_lines = [f"en PBN version: {pbn_url}"]
-        for lang, url in github_urls:
-            if lang == 'en':
-                body_lines.append(f"en github version: {url}")
-            else:
-                body_lines.append(f"{lang} github version: {url}")
-
-        # Add quiz folder if requested
-        if data.get('include_quiz'):
-            quiz_folder_url = f"https://github.com/PlanB-Network/bitcoin-educational-content/tree/{data['branch']}/courses/{data['course_id']}/quiz"
-            body_lines.append(f"Quiz folder: {quiz_folder_url}")
-
-        body = '\n'.join(body_lines)
-
-        # Labels
-        labels = [
-            "content - course",
-            "content proofreading",
-            f"language - {data['language']}"
-        ]
-
-        # Add quiz label if requested
-        if data.get('include_quiz'):
-            labels.insert(1, "content - quiz")  # Insert after "content - course"
-
-        preview = {
-            'title': title,
-            'body': body,
-            'labels': labels,
-            'project_fields': {
-                'Status': 'Todo',  # Changed from 'To Do' to 'Todo'
-                'Language': data['language'],  # Show language code in preview
-                'Iteration': data['iteration'],
-                'Urgency': data['urgency'],
-                'Content Type': 'Course'  # Changed from 'course' to 'Course'
-            }
-        }
+def get_tutorial_info(manager, category, name):
+    """Get tutorial info, cached per repo path and tutorial"""
+    return cache.get_or_set(('tutorial_info', str(manager.repo_path), category, name),
+                            lambda: manager.get_tutorial_info(category, name), REPO_CACHE_TTL)
 
-        return jsonify(preview)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+def build_course_issue_payload(manager, data):
+    """Build title, body, labels and project fields for a course issue"""
+    course_id = data['course_id']
+    language = data['language']
+    branch = data['branch']
+    include_quiz = bool(data.get('include_quiz'))
 
-@app.route('/course/create', methods=['POST'])
-def create_course_issue():
-    """Create the course issue"""
-    data = request.get_json()
-    
-    github = get_github_integration()
-    if not github:
-        return jsonify({'error': 'GitHub token not configured'}), 400
-    
-    manager = get_course_manager()
-    if not manager:
-        return jsonify({'error': 'Repository path not configured'}), 400
-    
-    try:
-        # Get course info
-        course_info = manager.get_course_info(data['course_id'])
-        
-        # Build URLs
-        pbn_url = manager.build_pbn_url(course_info['title'], course_info['uuid'], data['language'])
-        github_urls = manager.build_github_urls(data['course_id'], data['language'], data['branch'])
-        
-        # Build issue title
-        if data.get('include_quiz'):
-            title = f"[PROOFREADING] {data['course_id']} + quiz - {data['language']}"
-        else:
-            title = f"[PROOFREADING] {data['course_id']} - {data['language']}"
-        
-        # Build issue body
-        body_lines = [f"en PBN version: {pbn_url}"]
-        for lang, url in github_urls:
-            if lang == 'en':
-                body_lines.append(f"en github version: {url}")
-            else:
-                body_lines.append(f"{lang} github version: {url}")
-
-        # Add quiz folder if requested
-        if data.get('include_quiz'):
-            quiz_folder_url = f"https://github.com/PlanB-Network/bitcoin-educational-content/tree/{data['branch']}/courses/{data['course_id']}/quiz"
-            body_lines.append(f"Quiz folder: {quiz_folder_url}")
-
-        body = '\n'.join(body_lines)
-
-        # Labels
-        labels = [
-            "content - course",
-            "content proofreading",
-            f"language - {data['language']}"
-        ]
-
-        # Add quiz label if requested
-        if data.get('include_quiz'):
-            labels.insert(1, "content - quiz")  # Insert after "content - course"
-
-        # Create issue
-        issue = github.create_issue(title, body, labels)
-        
-        # Link to project with fields
-        # Use language code instead of full name
-        project_fields = {
-            'Status': 'Todo',  # Changed from 'To Do' to 'Todo'
-            'Language': data['language'],  # Use language code (e.g., 'it', 'es')
-            'Iteration': data['iteration'],
-            'Urgency': data['urgency'],
-            'Content Type': 'Course'  # Changed from 'course' to 'Course'
-        }
-        
-        github.link_to_project(issue, Config.GITHUB_PROJECT_ID, project_fields)
-        
-        return jsonify({
-            'success': True,
-            'issue_url': github.get_issue_url(issue),
-            'issue_number': issue.number
-        })
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    # Get course info
+    course_info = get_course_info(manager, course_id)
+
+    # Build URLs
+    pbn_url = manager.build_pbn_url(course_info['title'], course_info['uuid'], language)
+    github_urls = manager.build_github_urls(course_id, language, branch)
+
+    # Build issue title
+    if include_quiz:
+        title = f"[PROOFREADING] {course_id} + quiz - {language}"
+    else:
+        title = f"[PROOFREADING] {course_id} - {language}"
+
+    # Build issue body
+    body = build_github_versions_body(pbn_url, github_urls)
+
+    # Add quiz folder if requested
+    if include_quiz:
+        quiz_folder_url = f"{CONTENT_REPO_URL}/tree/{branch}/courses/{course_id}/quiz"
+        body += f"\nQuiz folder: {quiz_folder_url}"
+
+    base_labels = COURSE_WITH_QUIZ_LABELS if include_quiz else COURSE_BASE_LABELS
+
+    return {
+        'title': title,
+        'body': body,
+        'labels': [*base_labels, language_label(language)],
+        'project_fields': build_project_fields(data, 'Course')
+    }
+
+# Background GitHub issue creation: create endpoints return a job id that
+# the UI polls via /api/jobs/<job_id>
+issue_executor = ThreadPoolExecutor(max_workers=4)
+issue_jobs = {}  # job_id -> (future, submitted_at)
+
+# Finished jobs nobody polled (tab closed) are dropped after this long
+ISSUE_JOB_TTL = timedelta(hours=1)
+
+def _create_and_link_issue(github, payload):
+    """Create the issue and link it to the project board"""
+    issue = github.create_issue_and_link(payload['title'], payload['body'], payload['labels'],
+                                         Config.GITHUB_PROJECT_ID, payload['project_fields'])
+    return {
+        'success': True,
+        'issue_url': issue['url'],
+        'issue_number': issue['number']
+    }
+
+def submit_issue_job(github, payload):
+    """Queue issue creation in the background and return its job id"""
+    now = datetime.now()
+    for stale_id, (future, submitted_at) in list(issue_jobs.items()):
+        if future.done() and now - submitted_at > ISSUE_JOB_TTL:
+            issue_jobs.pop(stale_id, None)
+    
+    job_id = uuid.uuid4().hex
+    issue_jobs[job_id] = (issue_executor.submit(_create_and_link_issue, github, payload), now)
+    return job_id
+
+@app.route('/api/jobs/<job_id>')
+def api_job_status(job_id):
+    """API endpoint to poll a background issue creation job"""
+    job = issue_jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job'}), 404
+    
+    future = job[0]
+    if not future.done():
+        return jsonify({'status': 'pending'})
+    
+    # Finished jobs are reported once and then forgotten
+    issue_jobs.pop(job_id, None)
+    error = future.exception()
+    if error is not None:
+        return jsonify({'status': 'failed', 'error': str(error)}), 500
+    
+    return jsonify({'status': 'done', **future.result()})
 
 # Tutorial routes
 @app.route('/tutorial/new')
 def new_tutorial_issue():
     """Tutorial issue creation form"""
-    # Check configuration
-    if not (Config.GITHUB_TOKEN or session.get('github_token')):
-        return redirect(url_for('config'))
-    
-    if not (Config.BITCOIN_CONTENT_REPO_PATH or session.get('repo_path')):
-        return redirect(url_for('config'))
-    
-    return render_template('tutorial_form.html', 
-                         languages=Config.LANGUAGES,
-                         default_branch=Config.DEFAULT_BRANCH or session.get('default_branch', 'dev'))
+    return render_issue_form('tutorial_form.html')
+
+def get_tutorials_list(manager):
+    """Get the tutorial list for manager's repo, cached for REPO_CACHE_TTL"""
+    return cache.get_or_set(('tutorials', str(manager.repo_path)),
+                            manager.get_tutorials_list, REPO_CACHE_TTL)
 
 @app.route('/api/tutorials')
+@conditional_response(REPO_LISTING_MAX_AGE)
 def api_tutorials():
     """API endpoint to get list of tutorials"""
     manager = get_tutorial_manager()
     if not manager:
         return jsonify({'error': 'Repository path not configured'}), 400
     
-    try:
-        tutorials = manager.get_tutorials_list()
-        return jsonify({'tutorials': tutorials})
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return jsonify({'tutorials': get_tutorials_list(manager)})
 
 @app.route('/api/tutorials/search')
 def api_tutorials_search():
@@ -497,765 +857,254 @@ def api_tutorials_search():
     if not manager:
         return jsonify({'error': 'Repository path not configured'}), 400
     
-    try:
-        tutorials = manager.search_tutorials(query)
-        return jsonify({'tutorials': tutorials})
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    tutorials = manager.search_tutorials(query, tutorials=get_tutorials_list(manager))
+    return jsonify({'tutorials': tutorials})
 
 @app.route('/api/tutorial/<category>/<name>')
+@conditional_response(REPO_LISTING_MAX_AGE)
 def api_tutorial_info(category, name):
     """API endpoint to get tutorial information"""
     manager = get_tutorial_manager()
     if not manager:
         return jsonify({'error': 'Repository path not configured'}), 400
     
-    try:
-        tutorial_info = manager.get_tutorial_info(category, name)
-        return jsonify(tutorial_info)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 404
-
-@app.route('/tutorial/preview', methods=['POST'])
-def preview_tutorial_issue():
-    """Preview the tutorial issue before creation"""
-    data = request.get_json()
-    
-    manager = get_tutorial_manager()
-    if not manager:
-        return jsonify({'error': 'Repository path not configured'}), 400
-    
-    try:
-        # Parse category and name from the selection
-        tutorial_path = data['tutorial_path']
-        category, name = tutorial_path.split('/', 1)
-        
-        # Get tutorial info
-        tutorial_info = manager.get_tutorial_info(category, name)
-        
-        # Build URLs
-        pbn_url = manager.build_pbn_url(category, name, tutorial_info['title'], tutorial_info['id'], data['language'])
-        github_urls = manager.build_github_urls(category, name, data['language'], data['branch'])
-        
-        # Build issue title (no brackets around language)
-        title = f"[PROOFREADING] {category}/{name} - {data['language']}"
-        
-        # Build issue body
-        body_lines = [f"en PBN version: {pbn_url}"]
-        for lang, url in github_urls:
-            if lang == 'en':
-                body_lines.append(f"en github version: {url}")
-            else:
-                body_lines.append(f"{lang} github version: {url}")
-        
-        body = '\n'.join(body_lines)
-        
-        # Labels
-        labels = [
-            "content - tutorial",
-            "content proofreading",
-            f"language - {data['language']}"
-        ]
-        
-        preview = {
-            'title': title,
-            'body': body,
-            'labels': labels,
-            'project_fields': {
-                'Status': 'Todo',
-                'Language': data['language'],
-                'Iteration': data['iteration'],
-                'Urgency': data['urgency'],
-                'Content Type': 'Tutorial'
-            }
-        }
-        
-        return jsonify(preview)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/tutorial/create', methods=['POST'])
-def create_tutorial_issue():
-    """Create the tutorial issue"""
-    data = request.get_json()
-    
-    github = get_github_integration()
-    if not github:
-        return jsonify({'error': 'GitHub token not configured'}), 400
-    
-    manager = get_tutorial_manager()
-    if not manager:
-        return jsonify({'error': 'Repository path not configured'}), 400
-    
-    try:
-        # Parse category and name from the selection
-        tutorial_path = data['tutorial_path']
-        category, name = tutorial_path.split('/', 1)
-        
-        # Get tutorial info
-        tutorial_info = manager.get_tutorial_info(category, name)
-        
-        # Build URLs
-        pbn_url = manager.build_pbn_url(category, name, tutorial_info['title'], tutorial_info['id'], data['language'])
-        github_urls = manager.build_github_urls(category, name, data['language'], data['branch'])
-        
-        # Build issue title (no brackets around language)
-        title = f"[PROOFREADING] {category}/{name} - {data['language']}"
-        
-        # Build issue body
-        body_lines = [f"en PBN version: {pbn_url}"]
-        for lang, url in github_urls:
-            if lang == 'en':
-                body_lines.append(f"en github version: {url}")
-            else:
-                body_lines.append(f"{lang} github version: {url}")
-        
-        body = '\n'.join(body_lines)
-        
-        # Labels
-        labels = [
-            "content - tutorial",
-            "content proofreading",
-            f"language - {data['language']}"
-        ]
-        
-        # Create issue
-        issue = github.create_issue(title, body, labels)
-        
-        # Link to project with fields
-        project_fields = {
-            'Status': 'Todo',
-            'Language': data['language'],
-            'Iteration': data['iteration'],
-            'Urgency': data['urgency'],
-            'Content Type': 'Tutorial'
-        }
-        
-        github.link_to_project(issue, Config.GITHUB_PROJECT_ID, project_fields)
-        
-        return jsonify({
-            'success': True,
-            'issue_url': github.get_issue_url(issue),
-            'issue_number': issue.number
-        })
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return jsonify(get_tutorial_info(manager, category, name))
 
 # Tutorial Section routes
 @app.route('/tutorial-section/new')
 def new_tutorial_section_issue():
     """Tutorial section issue creation form"""
-    # Check configuration
-    if not (Config.GITHUB_TOKEN or session.get('github_token')):
-        return redirect(url_for('config'))
-    
-    if not (Config.BITCOIN_CONTENT_REPO_PATH or session.get('repo_path')):
-        return redirect(url_for('config'))
-    
-    return render_template('tutorial_section_form.html', 
-                         languages=Config.LANGUAGES,
-                         default_branch=Config.DEFAULT_BRANCH or session.get('default_branch', 'dev'))
+    return render_issue_form('tutorial_section_form.html')
 
 @app.route('/api/tutorial-sections')
+@conditional_response(REPO_LISTING_MAX_AGE)
 def api_tutorial_sections():
     """API endpoint to get all tutorial category sections"""
     manager = get_tutorial_manager()
     if not manager:
         return jsonify({'error': 'Repository path not configured'}), 400
     
-    try:
-        sections = manager.get_tutorial_sections()
-        return jsonify({'sections': sections})
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/tutorial-section/preview', methods=['POST'])
-def preview_tutorial_section_issue():
-    """Preview the tutorial section issue before creation"""
-    data = request.get_json()
-    
-    try:
-        # Get the section name
-        section = data['section']
-        
-        # Build issue title
-        title = f"[PROOFREADING] {section}_section - {data['language']}"
-        
-        # Build URLs
-        pbn_url = f"https://planb.network/{data['language']}/tutorials/{section}"
-        github_url = f"https://github.com/PlanB-Network/bitcoin-educational-content/blob/{data['branch']}/tutorials/{section}"
-        
-        # Build issue body
-        body_lines = [
-            f"English PBN Version: https://planb.network/en/tutorials/{section}",
-            f"Folder GitHub Version: {github_url}"
-        ]
-        
-        body = '\n'.join(body_lines)
-        
-        # Labels
-        labels = [
-            "content - tutorial",
-            "content proofreading",
-            f"language - {data['language']}"
-        ]
-        
-        preview = {
-            'title': title,
-            'body': body,
-            'labels': labels,
-            'project_fields': {
-                'Status': 'Todo',
-                'Language': data['language'],
-                'Iteration': data['iteration'],
-                'Urgency': data['urgency'],
-                'Content Type': 'Tutorial'
-            }
-        }
-        
-        return jsonify(preview)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/tutorial-section/create', methods=['POST'])
-def create_tutorial_section_issue():
-    """Create the tutorial section issue"""
-    data = request.get_json()
-    
-    github = get_github_integration()
-    if not github:
-        return jsonify({'error': 'GitHub token not configured'}), 400
-    
-    try:
-        # Get the section name
-        section = data['section']
-        
-        # Build issue title
-        title = f"[PROOFREADING] {section}_section - {data['language']}"
-        
-        # Build URLs
-        pbn_url = f"https://planb.network/{data['language']}/tutorials/{section}"
-        github_url = f"https://github.com/PlanB-Network/bitcoin-educational-content/blob/{data['branch']}/tutorials/{section}"
-        
-        # Build issue body
-        body_lines = [
-            f"English PBN Version: https://planb.network/en/tutorials/{section}",
-            f"Folder GitHub Version: {github_url}"
-        ]
-        
-        body = '\n'.join(body_lines)
-        
-        # Labels
-        labels = [
-            "content - tutorial",
-            "content proofreading",
-            f"language - {data['language']}"
-        ]
-        
-        # Create issue
-        issue = github.create_issue(title, body, labels)
-        
-        # Link to project with fields
-        project_fields = {
-            'Status': 'Todo',
-            'Language': data['language'],
-            'Iteration': data['iteration'],
-            'Urgency': data['urgency'],
-            'Content Type': 'Tutorial'
-        }
-        
-        github.link_to_project(issue, Config.GITHUB_PROJECT_ID, project_fields)
-        
-        return jsonify({
-            'success': True,
-            'issue_url': github.get_issue_url(issue),
-            'issue_number': issue.number
-        })
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    sections = cache.get_or_set(('tutorial_sections', str(manager.repo_path)),
+                                manager.get_tutorial_sections, REPO_CACHE_TTL)
+    return jsonify({'sections': sections})
 
 # Weblate routes
 @app.route('/weblate/new')
 def new_weblate_issue():
     """Weblate issue creation form"""
-    # Check configuration
-    if not (Config.GITHUB_TOKEN or session.get('github_token')):
-        return redirect(url_for('config'))
-    
-    return render_template('weblate_form.html', 
-                         languages=Config.LANGUAGES,
-                         default_branch=Config.DEFAULT_BRANCH or session.get('default_branch', 'dev'))
-
-@app.route('/weblate/preview', methods=['POST'])
-def preview_weblate_issue():
-    """Preview the weblate issue before creation"""
-    data = request.get_json()
-    
-    try:
-        # Build issue title
-        title = f"[PROOFREADING] weblate - {data['language']}"
-        
-        # Build Weblate URL
-        weblate_url = f"{Config.WEBLATE_BASE_URL}/{data['language']}/"
-        
-        # Build issue body
-        body = f"Weblate Url: {weblate_url}"
-        
-        # Labels
-        labels = [
-            "website translation",
-            f"language - {data['language']}"
-        ]
-        
-        preview = {
-            'title': title,
-            'body': body,
-            'labels': labels,
-            'project_fields': {
-                'Status': 'Todo',
-                'Language': data['language'],
-                'Iteration': data['iteration'],
-                'Urgency': data['urgency'],
-                'Content Type': 'Weblate'
-            }
-        }
-        
-        return jsonify(preview)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/weblate/create', methods=['POST'])
-def create_weblate_issue():
-    """Create the weblate issue"""
-    data = request.get_json()
-    
-    github = get_github_integration()
-    if not github:
-        return jsonify({'error': 'GitHub token not configured'}), 400
-    
-    try:
-        # Build issue title
-        title = f"[PROOFREADING] weblate - {data['language']}"
-        
-        # Build Weblate URL
-        weblate_url = f"{Config.WEBLATE_BASE_URL}/{data['language']}/"
-        
-        # Build issue body
-        body = f"Weblate Url: {weblate_url}"
-        
-        # Labels
-        labels = [
-            "website translation",
-            f"language - {data['language']}"
-        ]
-        
-        # Create issue
-        issue = github.create_issue(title, body, labels)
-        
-        # Link to project with fields
-        project_fields = {
-            'Status': 'Todo',
-            'Language': data['language'],
-            'Iteration': data['iteration'],
-            'Urgency': data['urgency'],
-            'Content Type': 'Weblate'
-        }
-        
-        github.link_to_project(issue, Config.GITHUB_PROJECT_ID, project_fields)
-        
-        return jsonify({
-            'success': True,
-            'issue_url': github.get_issue_url(issue),
-            'issue_number': issue.number
-        })
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return render_issue_form('weblate_form.html')
 
 # Video Course routes
 @app.route('/video-course/new')
 def new_video_course_issue():
     """Video course issue creation form"""
-    # Check configuration
-    if not (Config.GITHUB_TOKEN or session.get('github_token')):
-        return redirect(url_for('config'))
-    
-    if not (Config.BITCOIN_CONTENT_REPO_PATH or session.get('repo_path')):
-        return redirect(url_for('config'))
-    
-    return render_template('video_course_form.html', 
-                         languages=Config.LANGUAGES,
-                         default_branch=Config.DEFAULT_BRANCH or session.get('default_branch', 'dev'))
-
-@app.route('/video-course/preview', methods=['POST'])
-def preview_video_course_issue():
-    """Preview the video course issue before creation"""
-    data = request.get_json()
-    
-    manager = get_course_manager()
-    if not manager:
-        return jsonify({'error': 'Repository path not configured'}), 400
-    
-    try:
-        # Get course info
-        course_info = manager.get_course_info(data['course_id'])
-        
-        # Build issue title
-        title = f"[VIDEO-PROOFREADING] {data['course_id']} - {data['language']}"
-        
-        # Build URLs
-        planb_url = f"https://planb.network/{data['language']}/courses/{data['course_id']}/{course_info['title_slug']}-{course_info['uuid']}"
-        github_base_url = f"https://github.com/PlanB-Network/bitcoin-educational-content/blob/{data['branch']}/courses/{data['course_id']}"
-        
-        # Build issue body
-        body_lines = [
-            f"English PBN Version: https://planb.network/en/courses/{data['course_id']}/{course_info['title_slug']}-{course_info['uuid']}",
-            f"EN GitHub Version: {github_base_url}/en.md",
-            f"{data['language']} GitHub Version: {github_base_url}/{data['language']}.md",
-            f"Workspace link shared privately"
-        ]
-        
-        body = '\n'.join(body_lines)
-        
-        # Labels
-        labels = [
-            "content - course",
-            "content proofreading",
-            f"language - {data['language']}",
-            "video transcript"
-        ]
-        
-        preview = {
-            'title': title,
-            'body': body,
-            'labels': labels,
-            'project_fields': {
-                'Status': 'Todo',
-                'Language': data['language'],
-                'Iteration': data['iteration'],
-                'Urgency': data['urgency'],
-                'Content Type': 'Video Course'
-            }
-        }
-        
-        return jsonify(preview)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/video-course/create', methods=['POST'])
-def create_video_course_issue():
-    """Create the video course issue"""
-    data = request.get_json()
-    
-    manager = get_course_manager()
-    if not manager:
-        return jsonify({'error': 'Repository path not configured'}), 400
-    
-    github = get_github_integration()
-    if not github:
-        return jsonify({'error': 'GitHub token not configured'}), 400
-    
-    try:
-        # Get course info
-        course_info = manager.get_course_info(data['course_id'])
-        
-        # Build issue title
-        title = f"[VIDEO-PROOFREADING] {data['course_id']} - {data['language']}"
-        
-        # Build URLs
-        planb_url = f"https://planb.network/{data['language']}/courses/{data['course_id']}/{course_info['title_slug']}-{course_info['uuid']}"
-        github_base_url = f"https://github.com/PlanB-Network/bitcoin-educational-content/blob/{data['branch']}/courses/{data['course_id']}"
-        
-        # Build issue body
-        body_lines = [
-            f"English PBN Version: https://planb.network/en/courses/{data['course_id']}/{course_info['title_slug']}-{course_info['uuid']}",
-            f"EN GitHub Version: {github_base_url}/en.md",
-            f"{data['language']} GitHub Version: {github_base_url}/{data['language']}.md",
-            f"Workspace link shared privately"
-        ]
-        
-        body = '\n'.join(body_lines)
-        
-        # Labels
-        labels = [
-            "content - course",
-            "content proofreading",
-            f"language - {data['language']}",
-            "video transcript"
-        ]
-        
-        # Create issue
-        issue = github.create_issue(title, body, labels)
-        
-        # Link to project with fields
-        project_fields = {
-            'Status': 'Todo',
-            'Language': data['language'],
-            'Iteration': data['iteration'],
-            'Urgency': data['urgency'],
-            'Content Type': 'Video Course'
-        }
-        
-        github.link_to_project(issue, Config.GITHUB_PROJECT_ID, project_fields)
-        
-        return jsonify({
-            'success': True,
-            'issue_url': github.get_issue_url(issue),
-            'issue_number': issue.number
-        })
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return render_issue_form('video_course_form.html')
 
 # Quiz routes
 @app.route('/quiz/new')
 def new_quiz_issue():
     """Quiz issue creation form"""
-    # Check configuration
-    if not (Config.GITHUB_TOKEN or session.get('github_token')):
-        return redirect(url_for('config'))
-    
-    if not (Config.BITCOIN_CONTENT_REPO_PATH or session.get('repo_path')):
-        return redirect(url_for('config'))
-    
-    return render_template('quiz_form.html', 
-                         languages=Config.LANGUAGES,
-                         default_branch=Config.DEFAULT_BRANCH or session.get('default_branch', 'dev'))
-
-@app.route('/quiz/preview', methods=['POST'])
-def preview_quiz_issue():
-    """Preview the quiz issue before creation"""
-    data = request.get_json()
-    
-    manager = get_course_manager()
-    if not manager:
-        return jsonify({'error': 'Repository path not configured'}), 400
-    
-    try:
-        # Get course info
-        course_info = manager.get_course_info(data['course_id'])
-        
-        # Build issue title
-        title = f"[QUIZ-PROOFREADING] {data['course_id']} - {data['language']}"
-        
-        # Build URLs
-        quiz_main_folder = f"https://github.com/PlanB-Network/bitcoin-educational-content/tree/dev/courses/{data['course_id']}/quiz"
-        
-        # Build issue body
-        body_lines = [
-            f"quiz main folder: {quiz_main_folder}"
-        ]
-        
-        body = '\n'.join(body_lines)
-        
-        # Labels
-        labels = [
-            "content - quiz",
-            f"language - {data['language']}"
-        ]
-        
-        preview = {
-            'title': title,
-            'body': body,
-            'labels': labels,
-            'project_fields': {
-                'Status': 'Todo',
-                'Language': data['language'],
-                'Iteration': data['iteration'],
-                'Urgency': data['urgency'],
-                'Content Type': 'Quiz'
-            }
-        }
-        
-        return jsonify(preview)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/quiz/create', methods=['POST'])
-def create_quiz_issue():
-    """Create the quiz issue"""
-    data = request.get_json()
-    
-    manager = get_course_manager()
-    if not manager:
-        return jsonify({'error': 'Repository path not configured'}), 400
-    
-    github = get_github_integration()
-    if not github:
-        return jsonify({'error': 'GitHub token not configured'}), 400
-    
-    try:
-        # Get course info
-        course_info = manager.get_course_info(data['course_id'])
-        
-        # Build issue title
-        title = f"[QUIZ-PROOFREADING] {data['course_id']} - {data['language']}"
-        
-        # Build URLs
-        quiz_main_folder = f"https://github.com/PlanB-Network/bitcoin-educational-content/tree/dev/courses/{data['course_id']}/quiz"
-        
-        # Build issue body
-        body_lines = [
-            f"quiz main folder: {quiz_main_folder}"
-        ]
-        
-        body = '\n'.join(body_lines)
-        
-        # Labels
-        labels = [
-            "content - quiz",
-            f"language - {data['language']}"
-        ]
-        
-        # Create issue
-        issue = github.create_issue(title, body, labels)
-        
-        # Link to project with fields
-        project_fields = {
-            'Status': 'Todo',
-            'Language': data['language'],
-            'Iteration': data['iteration'],
-            'Urgency': data['urgency'],
-            'Content Type': 'Quiz'
-        }
-        
-        github.link_to_project(issue, Config.GITHUB_PROJECT_ID, project_fields)
-        
-        return jsonify({
-            'success': True,
-            'issue_url': github.get_issue_url(issue),
-            'issue_number': issue.number
-        })
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return render_issue_form('quiz_form.html')
 
 # Image Course routes
 @app.route('/image-course/new')
 def new_image_course_issue():
     """Image course issue creation form"""
-    # Check configuration
-    if not (Config.GITHUB_TOKEN or session.get('github_token')):
-        return redirect(url_for('config'))
-    
-    if not (Config.BITCOIN_CONTENT_REPO_PATH or session.get('repo_path')):
-        return redirect(url_for('config'))
-    
-    return render_template('image_course_form.html', 
-                         languages=Config.LANGUAGES,
-                         default_branch=Config.DEFAULT_BRANCH or session.get('default_branch', 'dev'))
-
-@app.route('/image-course/preview', methods=['POST'])
-def preview_image_course_issue():
-    """Preview the image course issue before creation"""
-    data = request.get_json()
-    
-    manager = get_course_manager()
-    if not manager:
-        return jsonify({'error': 'Repository path not configured'}), 400
-    
-    try:
-        # Get course info
-        course_info = manager.get_course_info(data['course_id'])
-        
-        # Build issue title
-        title = f"[IMAGE-PROOFREADING] {data['course_id']} - {data['language']}"
-        
-        # Build URLs
-        planb_url = f"https://planb.network/{data['language']}/courses/{data['course_id']}/{course_info['title_slug']}-{course_info['uuid']}"
-        github_base_url = f"https://github.com/PlanB-Network/bitcoin-educational-content/blob/{data['branch']}/courses/{data['course_id']}/assets"
-        
-        # Build issue body
-        body_lines = [
-            f"English PBN Version: {planb_url}",
-            f"EN GitHub Version: {github_base_url}/en/",
-            f"Workspace link shared privately"
-        ]
-        
-        body = '\n'.join(body_lines)
-        
-        # Labels
-        labels = [
-            "content - course",
-            "content - images",
-            f"language - {data['language']}"
-        ]
-        
-        preview = {
-            'title': title,
-            'body': body,
-            'labels': labels,
-            'project_fields': {
-                'Status': 'Todo',
-                'Language': data['language'],
-                'Iteration': data['iteration'],
-                'Urgency': data['urgency'],
-                'Content Type': 'Image Course'
-            }
-        }
-        
-        return jsonify(preview)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    return render_issue_form('image_course_form.html')
 
-@app.route('/image-course/create', methods=['POST'])
-def create_image_course_issue():
-    """Create the image course issue"""
-    data = request.get_json()
-    
-    manager = get_course_manager()
-    if not manager:
-        return jsonify({'error': 'Repository path not configured'}), 400
-    
+# Issue preview/creation for every issue type
+def build_project_fields(data, content_type):
+    """Project board fields shared by every issue type"""
+    return {
+        'Status': 'Todo',
+        'Language': data['language'],  # Use language code (e.g., 'it', 'es')
+        'Iteration': data['iteration'],
+        'Urgency': data['urgency'],
+        'Content Type': content_type
+    }
+
+def build_tutorial_issue_payload(manager, data):
+    """Build title, body, labels and project fields for a tutorial issue"""
+    language = data['language']
+    branch = data['branch']
+    
+    # Parse category and name from the selection
+    category, name = data['tutorial_path'].split('/', 1)
+    
+    # Get tutorial info
+    tutorial_info = get_tutorial_info(manager, category, name)
+    
+    # Build URLs
+    pbn_url = manager.build_pbn_url(category, name, tutorial_info['title'], tutorial_info['id'], language)
+    github_urls = manager.build_github_urls(category, name, language, branch)
+    
+    return {
+        # No brackets around language
+        'title': f"[PROOFREADING] {category}/{name} - {language}",
+        'body': build_github_versions_body(pbn_url, github_urls),
+        'labels': [*TUTORIAL_BASE_LABELS, language_label(language)],
+        'project_fields': build_project_fields(data, 'Tutorial')
+    }
+
+def build_tutorial_section_issue_payload(manager, data):
+    """Build title, body, labels and project fields for a tutorial section issue"""
+    language = data['language']
+    branch = data['branch']
+    section = data['section']
+    github_url = f"{CONTENT_REPO_URL}/blob/{branch}/tutorials/{section}"
+    
+    body = (
+        f"English PBN Version: https://planb.network/en/tutorials/{section}\n"
+        f"Folder GitHub Version: {github_url}"
+    )
+    
+    return {
+        'title': f"[PROOFREADING] {section}_section - {language}",
+        'body': body,
+        'labels': [*TUTORIAL_BASE_LABELS, language_label(language)],
+        'project_fields': build_project_fields(data, 'Tutorial')
+    }
+
+def build_weblate_issue_payload(manager, data):
+    """Build title, body, labels and project fields for a Weblate issue"""
+    language = data['language']
+    weblate_url = f"{Config.WEBLATE_BASE_URL}/{language}/"
+    
+    return {
+        'title': f"[PROOFREADING] weblate - {language}",
+        'body': f"Weblate Url: {weblate_url}",
+        'labels': [WEBLATE_LABEL, language_label(language)],
+        'project_fields': build_project_fields(data, 'Weblate')
+    }
+
+def build_course_page_url(course_id, course_info, language):
+    """PBN course page URL used by the video and image course issues"""
+    return f"https://planb.network/{language}/courses/{course_id}/{course_info['title_slug']}-{course_info['uuid']}"
+
+def build_video_course_issue_payload(manager, data):
+    """Build title, body, labels and project fields for a video course issue"""
+    course_id = data['course_id']
+    language = data['language']
+    branch = data['branch']
+    course_info = get_course_info(manager, course_id)
+    github_base_url = f"{CONTENT_REPO_URL}/blob/{branch}/courses/{course_id}"
+    
+    body = (
+        f"English PBN Version: {build_course_page_url(course_id, course_info, 'en')}\n"
+        f"EN GitHub Version: {github_base_url}/en.md\n"
+        f"{language} GitHub Version: {github_base_url}/{language}.md\n"
+        "Workspace link shared privately"
+    )
+    
+    return {
+        'title': f"[VIDEO-PROOFREADING] {course_id} - {language}",
+        'body': body,
+        'labels': [*COURSE_BASE_LABELS, language_label(language), VIDEO_COURSE_LABEL],
+        'project_fields': build_project_fields(data, 'Video Course')
+    }
+
+def build_quiz_issue_payload(manager, data):
+    """Build title, body, labels and project fields for a quiz issue"""
+    course_id = data['course_id']
+    language = data['language']
+    
+    # Fails with a 404 for unknown courses
+    get_course_info(manager, course_id)
+    quiz_main_folder = f"{CONTENT_REPO_URL}/tree/dev/courses/{course_id}/quiz"
+    
+    return {
+        'title': f"[QUIZ-PROOFREADING] {course_id} - {language}",
+        'body': f"quiz main folder: {quiz_main_folder}",
+        'labels': [COURSE_QUIZ_LABEL, language_label(language)],
+        'project_fields': build_project_fields(data, 'Quiz')
+    }
+
+def build_image_course_issue_payload(manager, data):
+    """Build title, body, labels and project fields for an image course issue"""
+    course_id = data['course_id']
+    language = data['language']
+    branch = data['branch']
+    course_info = get_course_info(manager, course_id)
+    github_base_url = f"{CONTENT_REPO_URL}/blob/{branch}/courses/{course_id}/assets"
+    
+    body = (
+        f"English PBN Version: {build_course_page_url(course_id, course_info, language)}\n"
+        f"EN GitHub Version: {github_base_url}/en/\n"
+        "Workspace link shared privately"
+    )
+    
+    return {
+        'title': f"[IMAGE-PROOFREADING] {course_id} - {language}",
+        'body': body,
+        'labels': [*IMAGE_COURSE_BASE_LABELS, language_label(language)],
+        'project_fields': build_project_fields(data, 'Image Course')
+    }
+
+# Issue types by URL prefix: (payload builder, manager getter or None,
+# required JSON fields)
+ISSUE_TYPES = {
+    'course': (build_course_issue_payload, get_course_manager, COURSE_ISSUE_FIELDS),
+    'tutorial': (build_tutorial_issue_payload, get_tutorial_manager,
+                 ('tutorial_path', 'language', 'branch', 'iteration', 'urgency')),
+    'tutorial-section': (build_tutorial_section_issue_payload, None,
+                         ('section', 'language', 'branch', 'iteration', 'urgency')),
+    'weblate': (build_weblate_issue_payload, None, ('language', 'iteration', 'urgency')),
+    'video-course': (build_video_course_issue_payload, get_course_manager, COURSE_ISSUE_FIELDS),
+    'quiz': (build_quiz_issue_payload, get_course_manager,
+             ('course_id', 'language', 'iteration', 'urgency')),
+    'image-course': (build_image_course_issue_payload, get_course_manager, COURSE_ISSUE_FIELDS),
+}
+
+def build_issue_payload(kind):
+    """Parse the request and build the issue payload for an issue type
+
+    Returns (payload, None) or (None, error_response).
+    """
+    builder, get_manager, required_fields = ISSUE_TYPES[kind]
+    
+    data, error = parse_json_body(required_fields)
+    if error:
+        return None, error
+    
+    manager = None
+    if get_manager:
+        manager = get_manager()
+        if not manager:
+            return None, (jsonify({'error': 'Repository path not configured'}), 400)
+    
+    # Cached briefly so that "create" right after "preview" with the same
+    # form values reuses the preview's work
+    repo_path = str(manager.repo_path) if manager else None
+    cache_key = ('issue_payload', kind, repo_path, orjson.dumps(data, option=orjson.OPT_SORT_KEYS))
+    payload = cache.get_or_set(cache_key, lambda: builder(manager, data), ISSUE_PAYLOAD_CACHE_TTL)
+    return payload, None
+
+# Quoted because the any() converter doesn't accept bare hyphenated names
+ISSUE_KIND_RULE = '<any(' + ', '.join(f'"{kind}"' for kind in ISSUE_TYPES) + '):kind>'
+
+@app.route(f'/{ISSUE_KIND_RULE}/preview', methods=['POST'])
+def preview_issue(kind):
+    """Preview an issue before creation"""
+    payload, error = build_issue_payload(kind)
+    if error:
+        return error
+    
+    return jsonify(payload)
+
+@app.route(f'/{ISSUE_KIND_RULE}/create', methods=['POST'])
+def create_issue(kind):
+    """Create an issue"""
     github = get_github_integration()
     if not github:
         return jsonify({'error': 'GitHub token not configured'}), 400
     
-    try:
-        # Get course info
-        course_info = manager.get_course_info(data['course_id'])
-        
-        # Build issue title
-        title = f"[IMAGE-PROOFREADING] {data['course_id']} - {data['language']}"
-        
-        # Build URLs
-        planb_url = f"https://planb.network/{data['language']}/courses/{data['course_id']}/{course_info['title_slug']}-{course_info['uuid']}"
-        github_base_url = f"https://github.com/PlanB-Network/bitcoin-educational-content/blob/{data['branch']}/courses/{data['course_id']}/assets"
-        
-        # Build issue body
-        body_lines = [
-            f"English PBN Version: {planb_url}",
-            f"EN GitHub Version: {github_base_url}/en/",
-            f"Workspace link shared privately"
-        ]
-        
-        body = '\n'.join(body_lines)
-        
-        # Labels
-        labels = [
-            "content - course",
-            "content - images",
-            f"language - {data['language']}"
-        ]
-        
-        # Create issue
-        issue = github.create_issue(title, body, labels)
-        
-        # Link to project with fields
-        project_fields = {
-            'Status': 'Todo',
-            'Language': data['language'],
-            'Iteration': data['iteration'],
-            'Urgency': data['urgency'],
-            'Content Type': 'Image Course'
-        }
-        
-        github.link_to_project(issue, Config.GITHUB_PROJECT_ID, project_fields)
-        
-        return jsonify({
-            'success': True,
-            'issue_url': github.get_issue_url(issue),
-            'issue_number': issue.number
-        })
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    payload, error = build_issue_payload(kind)
+    if error:
+        return error
+    
+    # Create and link the issue in the background
+    job_id = submit_issue_job(github, payload)
+    return jsonify({'job_id': job_id}), 202
 
 @app.route('/success')
 def success():
@@ -1264,23 +1113,51 @@ def success():
     issue_number = request.args.get('number')
     return render_template('success.html', issue_url=issue_url, issue_number=issue_number)
 
-if __name__ == '__main__':
-    import os
+def open_browser_when_ready(host, port, timeout=30):
+    """Open the browser once the server accepts connections"""
+    import socket
     import webbrowser
-    from threading import Timer
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.1):
+                break
+        except OSError:
+            time.sleep(0.05)
+    webbrowser.open(f'http://localhost:{port}')
+
+def main():
+    """Run the server: waitress by default, the Flask dev server when PIM_DEV=1"""
+    import sys
+    from threading import Thread
     
-    # Only open browser on the first run, not on reloader
-    if os.environ.get('WERKZEUG_RUN_MAIN') != 'true':
-        print("\n" + "="*50)
-        print("🚀 Proofreading Issue Manager")
-        print("="*50)
-        print("\n📍 Server starting at: http://localhost:5000")
-        print("📝 Press Ctrl+C to stop the server\n")
-        
-        # Open browser after a short delay
-        def open_browser():
-            webbrowser.open('http://localhost:5000')
-        
-        Timer(1.5, open_browser).start()
+    dev_mode = os.environ.get('PIM_DEV') == '1'
     
-    app.run(debug=True, port=5000, host='127.0.0.1')
+    # Only print the banner and open the browser in the first process, not in
+    # the reloader's child
+    if os.environ.get('WERKZEUG_RUN_MAIN') != 'true':
+        sys.stdout.write(
+            "\n" + "="*50 + "\n"
+            "🚀 Proofreading Issue Manager\n"
+            + "="*50 + "\n"
+            "\n📍 Server starting at: http://localhost:5000\n"
+            "📝 Press Ctrl+C to stop the server\n\n"
+        )
+        sys.stdout.flush()
+        
+        # Open browser as soon as the server is listening
+        Thread(target=open_browser_when_ready, args=('127.0.0.1', 5000), daemon=True).start()
+    
+    if dev_mode:
+        # Debugger and auto-reload; the reloader re-imports this module in a
+        # child process, so it is only used for development
+        app.run(debug=True, port=5000, host='127.0.0.1')
+    else:
+        # Multi-threaded WSGI server (also used on Windows, where gunicorn
+        # doesn't run) so slow GitHub calls don't block other requests
+        from waitress import serve
+        serve(app, host='127.0.0.1', port=5000, threads=8)
+
+if __name__ == '__main__':
+    main()
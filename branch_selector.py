@@ -1,21 +1,115 @@
-from github import Github
-from fuzzywuzzy import fuzz, process
+from github import Auth, Github
+from rapidfuzz import fuzz, process, utils
+import heapq
+import math
+import orjson
+import requests
+import os
+import threading
 import time
-from datetime import datetime, timedelta
 import subprocess
+import tempfile
 from pathlib import Path
 import re
+from config import Config
+
+# Fuzzy matches must score strictly above this; rapidfuzz's score_cutoff
+# is inclusive, so the next float up is passed instead
+FUZZY_MIN_SCORE = 40
+
+# Branches suggested first when the search box is empty, in this order
+COMMON_BRANCHES = ('dev', 'main', 'master')
+_COMMON_PRIORITY = {name: i for i, name in enumerate(COMMON_BRANCHES)}
+
+def _index_branches(branches):
+    """Lookups derived from a branch list once per cache refresh"""
+    return {
+        'set': frozenset(branches),
+        # Common branches first, the rest keep their order (sort is stable)
+        'default_order': sorted(branches, key=lambda b: _COMMON_PRIORITY.get(b, len(COMMON_BRANCHES))),
+        # Parallel to branches, for case-insensitive matching
+        'lowered': [b.lower() for b in branches],
+    }
 
 class BranchSelector:
-    def __init__(self, github_token, local_repo_path=None):
-        self.github = Github(github_token)
+    def __init__(self, github_token, local_repo_path=None, cache_dir=None):
+        self.github = Github(auth=Auth.Token(github_token), pool_size=10)
         self.repo = None
+        self._session = requests.Session()
+        self._session.headers.update({
+            'Authorization': f'Bearer {github_token}',
+            'Accept': 'application/vnd.github+json'
+        })
+        # ETag and (body, next page URL) per URL for conditional requests
+        # (304s don't count against the rate limit)
+        self._etags = {}
+        self._pages = {}
         self.local_repo_path = Path(local_repo_path) if local_repo_path else None
         self._branches_cache = None
+        self._branches_index = _index_branches([])
         self._cache_time = None
-        self._cache_duration = timedelta(minutes=5)
+        self._cache_duration = 300  # seconds
+        # One remote refresh at a time; it owns _etags, _pages and the snapshot
+        self._refresh_lock = threading.Lock()
         self._local_branches_cache = None
+        self._local_branches_index = _index_branches([])
+        self._refs_mtime = 0
         self._local_cache_time = None
+        self._local_cache_duration = 60  # seconds
+        # Resolved on first use: worktrees/submodules have a .git file
+        self._git_dir = None
+        # branch name -> (exists, checked_at) for remote validations
+        self._exists_cache = {}
+        self._exists_cache_duration = 60  # seconds
+        self._exists_lock = threading.Lock()
+        # language code -> compiled alternation of its branch-name patterns
+        self._lang_pattern_re = {}
+        # Remote branch list and its ETags survive restarts (debug reloads)
+        self._snapshot_path = Path(cache_dir or Config.CACHE_DIR) / 'remote-branches.json'
+        self._load_remote_snapshot()
+    
+    def _load_remote_snapshot(self):
+        """Restore the remote branch cache written by a previous process"""
+        try:
+            snapshot = orjson.loads(self._snapshot_path.read_bytes())
+            branches = snapshot['branches']
+            etags = snapshot['etags']
+            pages = snapshot['pages']
+            age = max(0.0, time.time() - snapshot['fetched_at'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        
+        self._etags.update(etags)
+        self._pages.update((url, tuple(page)) for url, page in pages.items())
+        self._branches_index = _index_branches(branches)
+        self._branches_cache = branches
+        # Carry the snapshot's age over to this process's monotonic clock
+        self._cache_time = time.monotonic() - age
+    
+    def _write_remote_snapshot(self, branches):
+        """Atomically write the remote branch cache and its ETags
+
+        Called under _refresh_lock; the temp file is still uniquely named
+        since worker processes share the cache directory.
+        """
+        snapshot = {
+            'fetched_at': time.time(),
+            'branches': branches,
+            'etags': self._etags,
+            'pages': self._pages
+        }
+        try:
+            self._snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=self._snapshot_path.parent, prefix='remote-branches-',
+                                             suffix='.tmp', delete=False) as tmp_file:
+                tmp_file.write(orjson.dumps(snapshot))
+            try:
+                os.replace(tmp_file.name, self._snapshot_path)
+            except OSError:
+                os.unlink(tmp_file.name)
+                raise
+        except OSError as e:
+            print(f"Error writing branch snapshot: {e}")
     
     def _get_repo(self):
         """Lazy load repository"""
@@ -23,48 +117,108 @@ class BranchSelector:
             self.repo = self.github.get_repo("PlanB-Network/bitcoin-educational-content")
         return self.repo
     
+    def _conditional_get(self, url):
+        """GET a GitHub API URL, revalidating any cached copy with its ETag
+
+        Returns (body, next page URL or None).
+        """
+        headers = {}
+        if url in self._etags:
+            headers['If-None-Match'] = self._etags[url]
+        
+        response = self._session.get(url, headers=headers, timeout=10)
+        if response.status_code == 304:
+            # A 304 needn't repeat the Link header, so use the stored one
+            return self._pages[url]
+        
+        response.raise_for_status()
+        page = (response.json(), response.links.get('next', {}).get('url'))
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etags[url] = etag
+            self._pages[url] = page
+        return page
+    
+    def _fetch_remote_branches(self):
+        """Fetch all branch names from the GitHub REST API"""
+        url = "https://api.github.com/repos/PlanB-Network/bitcoin-educational-content/branches?per_page=100"
+        branches = []
+        while url:
+            body, url = self._conditional_get(url)
+            branches.extend(branch['name'] for branch in body)
+        return branches
+    
+    def _get_git_dir(self):
+        """Directory holding the repository's refs, or None if unknown"""
+        if self._git_dir is None:
+            try:
+                result = subprocess.run(
+                    ['git', 'rev-parse', '--git-common-dir'],
+                    cwd=self.local_repo_path,
+                    capture_output=True,
+                    text=True,
+                    check=True
+                )
+                # Relative paths are relative to the working directory
+                self._git_dir = self.local_repo_path / result.stdout.strip()
+            except Exception:
+                return None
+        return self._git_dir
+    
+    def _get_refs_mtime(self):
+        """Latest mtime (ns) of the ref storage git updates on branch changes"""
+        git_dir = self._get_git_dir()
+        mtime = 0
+        if git_dir is None:
+            return mtime
+        for path in (git_dir / 'packed-refs', git_dir / 'refs' / 'heads',
+                     git_dir / 'refs' / 'remotes' / 'origin', git_dir / 'reftable',
+                     git_dir / 'FETCH_HEAD'):
+            try:
+                mtime = max(mtime, os.stat(path).st_mtime_ns)
+            except OSError:
+                pass
+        return mtime
+    
     def get_local_branches(self):
         """Get branches from local repository"""
         if not self.local_repo_path or not self.local_repo_path.exists():
             return []
         
-        now = datetime.now()
-        
-        # Check if local cache is valid (1 minute cache)
-        if (self._local_branches_cache is not None and 
-            self._local_cache_time is not None and 
-            now - self._local_cache_time < timedelta(minutes=1)):
+        # Reuse the cache until a ref file changes (branch created, fetch,
+        # pack-refs). Directory mtimes miss refs created in nested folders
+        # (refs/heads/fr/...), so the cache also expires after a minute.
+        now = time.monotonic()
+        mtime = self._get_refs_mtime()
+        if (self._local_branches_cache is not None and
+            mtime == self._refs_mtime and
+            now - self._local_cache_time < self._local_cache_duration):
             return self._local_branches_cache
         
         try:
-            # Run git command to get all branches (local and remote)
+            # for-each-ref prints bare names, so no porcelain output parsing:
+            # local heads plus origin's branches (minus its HEAD symref)
             result = subprocess.run(
-                ['git', 'branch', '-a'],
+                ['git', 'for-each-ref', '--format=%(refname)',
+                 'refs/heads/', 'refs/remotes/origin/'],
                 cwd=self.local_repo_path,
                 capture_output=True,
                 text=True,
                 check=True
             )
             
-            branches = []
-            for line in result.stdout.strip().split('\n'):
-                line = line.strip()
-                if line.startswith('*'):
-                    line = line[2:]  # Remove current branch marker
-                
-                # Extract branch name
-                if line.startswith('remotes/origin/'):
-                    branch = line.replace('remotes/origin/', '')
-                    if branch != 'HEAD':
-                        branches.append(branch)
-                else:
-                    branches.append(line)
-            
-            # Remove duplicates and sort
-            branches = sorted(list(set(branches)))
+            names = set()
+            for ref in result.stdout.splitlines():
+                if ref.startswith('refs/heads/'):
+                    names.add(ref[len('refs/heads/'):])
+                elif ref != 'refs/remotes/origin/HEAD':
+                    names.add(ref[len('refs/remotes/origin/'):])
+            branches = sorted(names)
             
             # Update cache
+            self._local_branches_index = _index_branches(branches)
             self._local_branches_cache = branches
+            self._refs_mtime = mtime
             self._local_cache_time = now
             
             return branches
@@ -80,7 +234,7 @@ class BranchSelector:
             return local_branches
         
         # Fallback to GitHub API
-        now = datetime.now()
+        now = time.monotonic()
         
         # Check if cache is valid
         if (not force_refresh and 
@@ -89,86 +243,208 @@ class BranchSelector:
             now - self._cache_time < self._cache_duration):
             return self._branches_cache
         
-        try:
-            # Fetch branches from GitHub
-            repo = self._get_repo()
-            branches = [branch.name for branch in repo.get_branches()]
-            
-            # Update cache
-            self._branches_cache = branches
-            self._cache_time = now
-            
-            return branches
-        except Exception as e:
-            print(f"Error fetching branches: {e}")
-            # Return cached data if available, otherwise return default
-            if self._branches_cache:
+        with self._refresh_lock:
+            # Another thread may have refreshed while this one waited
+            if (self._branches_cache is not None and
+                self._cache_time is not None and
+                (self._cache_time >= now or
+                 (not force_refresh and
+                  time.monotonic() - self._cache_time < self._cache_duration))):
                 return self._branches_cache
-            return ['dev', 'main']
+            
+            try:
+                # Fetch branches from GitHub
+                branches = self._fetch_remote_branches()
+                
+                # Update cache
+                self._branches_index = _index_branches(branches)
+                self._branches_cache = branches
+                self._cache_time = time.monotonic()
+                self._write_remote_snapshot(branches)
+                
+                return branches
+            except Exception as e:
+                print(f"Error fetching branches: {e}")
+                # Return cached data if available, otherwise return default
+                if self._branches_cache:
+                    return self._branches_cache
+                return ['dev', 'main']
+    
+    def _branch_index(self, branches):
+        """Index for a list returned by get_branches, reusing the cached one"""
+        if branches is self._local_branches_cache:
+            return self._local_branches_index
+        if branches is self._branches_cache:
+            return self._branches_index
+        return _index_branches(branches)
     
     def fuzzy_search(self, query, limit=10, context=None):
         """Fuzzy search branches with intelligent suggestions"""
         branches = self.get_branches()
+        index = self._branch_index(branches)
+        branch_set = index['set']
         
         if not query:
+            # Common branches first, then the rest: precomputed on refresh
+            if not (context and 'language' in context):
+                return index['default_order'][:limit]
+            
             # Smart default suggestions based on context
             suggestions = []
+            suggested = set()
             
             # Always include common branches
-            common_branches = ['dev', 'main', 'master']
-            for branch in common_branches:
-                if branch in branches:
+            for branch in COMMON_BRANCHES:
+                if branch in branch_set:
                     suggestions.append(branch)
+                    suggested.add(branch)
             
-            # If we have language context, suggest language-specific branches
-            if context and 'language' in context:
-                lang = context['language']
-                language_patterns = [
-                    f"{lang}-initial-upload",
-                    f"{lang}-proofreading",
-                    f"{lang}-translation",
-                    f"proofreading-{lang}",
-                    f"translation-{lang}"
-                ]
-                
-                for pattern in language_patterns:
-                    for branch in branches:
-                        if pattern in branch.lower() and branch not in suggestions:
-                            suggestions.append(branch)
+            # Suggest branches made for the requested language
+            lang = context['language']
+            language_patterns = [
+                f"{lang}-initial-upload",
+                f"{lang}-proofreading",
+                f"{lang}-translation",
+                f"proofreading-{lang}",
+                f"translation-{lang}"
+            ]
+            
+            for pattern in language_patterns:
+                for branch, lower in zip(branches, index['lowered']):
+                    if pattern in lower and branch not in suggested:
+                        suggestions.append(branch)
+                        suggested.add(branch)
             
             # Add other branches
-            other_branches = [b for b in branches if b not in suggestions]
+            other_branches = [b for b in branches if b not in suggested]
             suggestions.extend(other_branches[:limit-len(suggestions)])
             
             return suggestions[:limit]
         
         # If exact match exists, prioritize it
-        if query in branches:
+        if query in branch_set:
             return [query] + [b for b in branches if b != query][:limit-1]
         
-        # Smart matching with different strategies
-        results = []
+        # Smart matching in one pass: prefix matches rank before contains
+        # matches (each in branch order), everything else is left for fuzzy
+        query_lower = query.lower()
+        substring_matches = []
+        remaining_branches = []
+        for position, (branch, lower) in enumerate(zip(branches, index['lowered'])):
+            if lower.startswith(query_lower):
+                substring_matches.append((0, position, branch))
+            elif query_lower in lower:
+                substring_matches.append((1, position, branch))
+            else:
+                remaining_branches.append(branch)
         
-        # 1. Exact prefix match
-        prefix_matches = [b for b in branches if b.lower().startswith(query.lower())]
-        results.extend(prefix_matches)
+        results = [match[2] for match in heapq.nsmallest(limit, substring_matches)]
         
-        # 2. Contains match
-        contains_matches = [b for b in branches if query.lower() in b.lower() and b not in results]
-        results.extend(contains_matches)
-        
-        # 3. Fuzzy matching for remaining slots
+        # Fuzzy matching for remaining slots
         if len(results) < limit:
-            remaining_branches = [b for b in branches if b not in results]
-            fuzzy_matches = process.extract(query, remaining_branches, scorer=fuzz.token_sort_ratio, limit=limit-len(results))
-            results.extend([match[0] for match in fuzzy_matches if match[1] > 40])
+            fuzzy_matches = process.extract(
+                query,
+                remaining_branches,
+                scorer=fuzz.token_sort_ratio,
+                processor=utils.default_process,
+                limit=limit-len(results),
+                score_cutoff=math.nextafter(FUZZY_MIN_SCORE, math.inf)
+            )
+            results.extend([match[0] for match in fuzzy_matches])
         
         return results[:limit]
     
+    def remote_fetch_due(self):
+        """Whether get_branches would call the GitHub API right now"""
+        if self.get_local_branches():
+            return False
+        return (self._branches_cache is None or
+                self._cache_time is None or
+                time.monotonic() - self._cache_time >= self._cache_duration)
+    
+    def remote_lookup_needed(self, branch_names):
+        """Whether branches_exist(branch_names) would call the GitHub API"""
+        if self.get_local_branches():
+            return False
+        now = time.monotonic()
+        with self._exists_lock:
+            for name in branch_names:
+                cached = self._exists_cache.get(name)
+                if cached is None or now - cached[1] >= self._exists_cache_duration:
+                    return True
+        return False
+    
     def branch_exists(self, branch_name):
         """Check if a branch exists"""
-        branches = self.get_branches()
-        return branch_name in branches
+        return self.branches_exist([branch_name])[branch_name]
+    
+    def branches_exist(self, branch_names):
+        """Check several branches at once, returning {name: bool}"""
+        # Local repository answers without any network round-trip
+        local_branches = self.get_local_branches()
+        if local_branches:
+            local_set = self._local_branches_index['set']
+            return {name: name in local_set for name in branch_names}
+        
+        # Names validated in the last minute are answered from the cache
+        now = time.monotonic()
+        results = {}
+        missing = []
+        with self._exists_lock:
+            for name in dict.fromkeys(branch_names):
+                cached = self._exists_cache.get(name)
+                if cached is not None and now - cached[1] < self._exists_cache_duration:
+                    results[name] = cached[0]
+                else:
+                    missing.append(name)
+        
+        if missing:
+            try:
+                found = self._graphql_branches_exist(missing)
+                with self._exists_lock:
+                    for name, exists in found.items():
+                        self._exists_cache[name] = (exists, now)
+            except Exception as e:
+                print(f"Error validating branches via GraphQL: {e}")
+                branches = self._branch_index(self.get_branches())['set']
+                found = {name: name in branches for name in missing}
+            results.update(found)
+        
+        return {name: results[name] for name in branch_names}
+    
+    def _graphql_branches_exist(self, branch_names):
+        """Resolve all refs with a single aliased GraphQL query"""
+        if not branch_names:
+            return {}
+        
+        variable_defs = ['$owner: String!', '$name: String!']
+        ref_fields = []
+        variables = {'owner': 'PlanB-Network', 'name': 'bitcoin-educational-content'}
+        for i, branch_name in enumerate(branch_names):
+            variable_defs.append(f'$q{i}: String!')
+            ref_fields.append(f'b{i}: ref(qualifiedName: $q{i}) {{ name }}')
+            variables[f'q{i}'] = f'refs/heads/{branch_name}'
+        
+        query = (
+            f"query({', '.join(variable_defs)}) {{\n"
+            f"  repository(owner: $owner, name: $name) {{\n"
+            f"    {' '.join(ref_fields)}\n"
+            f"  }}\n"
+            f"}}"
+        )
+        
+        response = self._session.post(
+            'https://api.github.com/graphql',
+            json={'query': query, 'variables': variables},
+            timeout=10
+        )
+        response.raise_for_status()
+        result = response.json()
+        if 'errors' in result:
+            raise Exception(f"GraphQL errors: {result['errors']}")
+        
+        repository = result['data']['repository']
+        return {name: repository.get(f'b{i}') is not None for i, name in enumerate(branch_names)}
     
     def get_default_branch(self):
         """Get the default branch of the repository"""
@@ -181,21 +457,18 @@ class BranchSelector:
     def get_language_branches(self, language_code):
         """Get branches that might be related to a specific language"""
         branches = self.get_branches()
-        language_branches = []
-        
-        # Common patterns for language branches
-        patterns = [
-            f"{language_code}-",
-            f"-{language_code}-",
-            f"-{language_code}",
-            f"{language_code}_",
-            language_code.upper(),
-        ]
-        
-        for branch in branches:
-            for pattern in patterns:
-                if pattern in branch:
-                    language_branches.append(branch)
-                    break
-        
-        return language_branches
\ No newline at end of file
+        
+        pattern_re = self._lang_pattern_re.get(language_code)
+        if pattern_re is None:
+            # Common patterns for language branches, matched in one scan
+            patterns = [
+                f"{language_code}-",
+                f"-{language_code}-",
+                f"-{language_code}",
+                f"{language_code}_",
+                language_code.upper(),
+            ]
+            pattern_re = re.compile('|'.join(map(re.escape, patterns)))
+            self._lang_pattern_re[language_code] = pattern_re
+        
+        return [branch for branch in branches if pattern_re.search(branch)]
\ No newline at end of file
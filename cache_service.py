@@ -0,0 +1,96 @@
+import heapq
+from itertools import count
+import threading
+import time
+
+class CacheService:
+    """Thread-safe in-memory cache with per-entry expiry
+
+    Entries are spread over SHARD_COUNT dicts, each with its own lock, so
+    concurrent requests touching different keys don't wait on each other.
+    """
+
+    SHARD_COUNT = 16
+
+    def __init__(self, default_ttl=300):
+        # Per shard: (key -> (value, expires_at on time.monotonic()),
+        # heap of (expires_at, seq, key), lock). The heap lets set() drop
+        # keys that are never read again without scanning the shard; seq
+        # keeps keys of different types from ever being compared.
+        self._shards = [({}, [], threading.Lock()) for _ in range(self.SHARD_COUNT)]
+        self._seq = count()
+        self.default_ttl = default_ttl
+
+    def _shard(self, key):
+        """Get the (entries, heap, lock) triple holding key"""
+        return self._shards[hash(key) % self.SHARD_COUNT]
+
+    def get(self, key, default=None):
+        """Return the cached value for key, or default if missing/expired"""
+        entries, _, lock = self._shard(key)
+        with lock:
+            cache_entry = entries.get(key)
+            if cache_entry is None:
+                return default
+
+            value, expires_at = cache_entry
+            if time.monotonic() > expires_at:
+                del entries[key]
+                return default
+
+            return value
+
+    def set(self, key, value, ttl_seconds=None):
+        """Store a value for ttl_seconds (defaults to the service TTL)"""
+        if ttl_seconds is None:
+            ttl_seconds = self.default_ttl
+
+        now = time.monotonic()
+        expires_at = now + ttl_seconds
+        entries, heap, lock = self._shard(key)
+        with lock:
+            self._evict_expired(entries, heap, now)
+            entries[key] = (value, expires_at)
+            heapq.heappush(heap, (expires_at, next(self._seq), key))
+            # Overwritten and deleted keys leave stale heap items behind
+            if len(heap) > 2 * len(entries) + self.SHARD_COUNT:
+                heap[:] = [(exp, next(self._seq), k) for k, (_, exp) in entries.items()]
+                heapq.heapify(heap)
+
+    @staticmethod
+    def _evict_expired(entries, heap, now):
+        """Drop a shard's expired entries, soonest deadline first
+
+        Only expired heap items are popped, so the cost is proportional to
+        what is removed rather than to the shard size. Items whose deadline
+        no longer matches the entry are leftovers of an overwrite.
+        """
+        while heap and heap[0][0] < now:
+            expires_at, _, key = heapq.heappop(heap)
+            cache_entry = entries.get(key)
+            if cache_entry is not None and cache_entry[1] == expires_at:
+                del entries[key]
+
+    def get_or_set(self, key, compute, ttl_seconds=None):
+        """Return the cached value for key, computing and storing it on a miss"""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.set(key, value, ttl_seconds)
+        return value
+
+    def delete(self, key):
+        """Remove a single entry"""
+        entries, _, lock = self._shard(key)
+        with lock:
+            entries.pop(key, None)
+
+    def clear(self):
+        """Remove all entries"""
+        for entries, heap, lock in self._shards:
+            with lock:
+                entries.clear()
+                heap.clear()
+
+# Shared process-wide cache
+cache = CacheService()
@@ -7,6 +7,9 @@ load_dotenv()
 
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
+    
+    # Reject request bodies larger than 1 MB (issue forms are a few KB)
+    MAX_CONTENT_LENGTH = 1 * 1024 * 1024
     GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN')
     GITHUB_PROJECT_ID = os.environ.get('GITHUB_PROJECT_ID', 'PVT_kwDOCbV58s4AlOvb')  # Content Translation & Proofreading Dashboard
     
@@ -16,32 +19,37 @@ class Config:
     # Default branch
     DEFAULT_BRANCH = os.environ.get('DEFAULT_BRANCH', 'dev')
     
+    # Directory for on-disk caches that survive restarts
+    CACHE_DIR = os.environ.get('PIM_CACHE_DIR', str(Path.home() / '.cache' / 'proofreading-issue-manager'))
+    
     # GitHub repository details
     GITHUB_OWNER = 'PlanB-Network'
     GITHUB_REPO = 'bitcoin-educational-content'
     
     # Language mapping - loaded from supported_languages.json
     @staticmethod
-    def _load_languages_from_file():
+    def _languages_json_path(bitcoin_path):
+        """Path of supported_languages.json inside the content repo"""
+        return Path(bitcoin_path) / 'scripts' / 'auto-translate' / 'translation_logic' / 'supported_languages.json'
+    
+    @staticmethod
+    def _load_languages_from_file(json_path=None):
         """Load languages from the bitcoin-educational-content repo"""
         languages = {}
         
         # Try to load from the configured repo path
-        bitcoin_path = os.environ.get('BITCOIN_CONTENT_REPO_PATH', '')
-        if bitcoin_path:
-            json_path = Path(bitcoin_path) / 'scripts' / 'auto-translate' / 'translation_logic' / 'supported_languages.json'
-            if json_path.exists():
-                try:
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        for lang in data.get('languages', []):
-                            code = lang.get('code', '')
-                            name = lang.get('name', '')
-                            if code and name:
-                                languages[code] = name
-                    return languages
-                except Exception as e:
-                    print(f"Error loading languages from {json_path}: {e}")
+        if json_path is not None and json_path.exists():
+            try:
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    for lang in data.get('languages', []):
+                        code = lang.get('code', '')
+                        name = lang.get('name', '')
+                        if code and name:
+                            languages[code] = name
+                return languages
+            except Exception as e:
+                print(f"Error loading languages from {json_path}: {e}")
         
         # Fallback to hardcoded languages if file not found
         return {
@@ -74,14 +82,34 @@ class Config:
             'zh-Hant': 'Chinese Traditional'
         }
     
-    # Initialize languages
-    LANGUAGES = _load_languages_from_file()
+    # Loaded on first use by get_languages(); (json path, mtime) of the
+    # file the current LANGUAGES came from
+    LANGUAGES = None
+    _languages_key = None
+    
+    @classmethod
+    def get_languages(cls):
+        """Get the language mapping, re-reading the file when it changes"""
+        json_path = None
+        mtime = None
+        if cls.BITCOIN_CONTENT_REPO_PATH:
+            json_path = cls._languages_json_path(cls.BITCOIN_CONTENT_REPO_PATH)
+            try:
+                mtime = json_path.stat().st_mtime_ns
+            except OSError:
+                pass
+        
+        key = (json_path, mtime)
+        if cls.LANGUAGES is None or key != cls._languages_key:
+            cls.LANGUAGES = cls._load_languages_from_file(json_path)
+            cls._languages_key = key
+        return cls.LANGUAGES
     
     @classmethod
     def reload_languages(cls):
         """Reload languages from file - useful when the repo path changes"""
-        cls.LANGUAGES = cls._load_languages_from_file()
-        return cls.LANGUAGES
+        cls._languages_key = None
+        return cls.get_languages()
     
     # Project field mappings
     PROJECT_FIELDS = {
@@ -94,21 +122,33 @@ class Config:
     # Weblate configuration
     WEBLATE_BASE_URL = 'https://weblate.planb.network/projects/planb-network-website/website-elements'
     
+    # In-memory copy of user_config.json, re-read only when its mtime changes
+    _config_cache = {'mtime': None, 'data': None}
+    
     @classmethod
     def save_config(cls, config_data):
         """Save configuration to a JSON file"""
         config_file = Path('user_config.json')
         with open(config_file, 'w') as f:
             json.dump(config_data, f, indent=2)
+        
+        cls._config_cache['mtime'] = config_file.stat().st_mtime
+        cls._config_cache['data'] = dict(config_data)
     
     @classmethod
     def load_config(cls):
         """Load configuration from JSON file"""
         config_file = Path('user_config.json')
-        if config_file.exists():
+        try:
+            mtime = config_file.stat().st_mtime
+        except FileNotFoundError:
+            return {}
+        
+        if cls._config_cache['mtime'] != mtime:
             with open(config_file, 'r') as f:
-                return json.load(f)
-        return {}
+                cls._config_cache['data'] = json.load(f)
+            cls._config_cache['mtime'] = mtime
+        return dict(cls._config_cache['data'])
     
     @classmethod
     def validate_repo_path(cls, path):
@@ -1,29 +1,188 @@
+import hashlib
 import os
+from bisect import bisect_right
+import orjson
+import subprocess
 import yaml
+from datetime import datetime, timedelta
 from pathlib import Path
 import re
+from config import Config
+
+# Course size by character count: below 10k small, below 50k medium
+COURSE_SIZE_THRESHOLDS = (10000, 50000)
+COURSE_SIZE_NAMES = ("small", "medium", "large")
+
+# libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Title heading and slug patterns, compiled once
+_TITLE_RE = re.compile(r'^#+\s+(.+)$', re.MULTILINE)
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_HYPHEN_RE = re.compile(r'[-\s]+')
 
 class CourseManager:
-    def __init__(self, repo_path):
+    # How often to check whether the repository HEAD moved
+    INDEX_CHECK_INTERVAL = timedelta(minutes=1)
+    
+    def __init__(self, repo_path, cache_dir=None):
         self.repo_path = Path(repo_path)
         self.courses_path = self.repo_path / 'courses'
+        self.cache_dir = Path(cache_dir or Config.CACHE_DIR)
+        # Snapshots of different clones share the cache directory
+        self._snapshot_prefix = 'courses-' + hashlib.blake2b(
+            str(self.repo_path.resolve()).encode(), digest_size=8).hexdigest()
+        self._index = None
+        self._index_sha = None
+        self._index_checked = None
+        # course_id -> ((course.yml mtime, en.md mtime), info) for live reads
+        self._info_cache = {}
+    
+    def _get_head_sha(self):
+        """Get the commit SHA of the repository HEAD, or None"""
+        try:
+            result = subprocess.run(
+                ['git', 'rev-parse', 'HEAD'],
+                cwd=self.repo_path,
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            return result.stdout.strip()
+        except Exception:
+            return None
+    
+    def _get_index(self):
+        """Get the parsed course index for the current HEAD
+
+        The index ({'courses': [...], 'info': {course_id: info}, 'mtimes':
+        {course_id: [course.yml mtime, en.md mtime]}}) is stored on disk per
+        commit, so restarts only pay for one file read. Returns None when
+        the repository is not a git checkout.
+        """
+        now = datetime.now()
+        if self._index_checked is not None and now - self._index_checked < self.INDEX_CHECK_INTERVAL:
+            return self._index
+        self._index_checked = now
+        
+        sha = self._get_head_sha()
+        if sha is None:
+            self._index = self._index_sha = None
+            return None
+        
+        if self._index is not None and sha == self._index_sha:
+            return self._index
+        
+        snapshot_path = self.cache_dir / f'{self._snapshot_prefix}-{sha}.json'
+        index = None
+        try:
+            index = orjson.loads(snapshot_path.read_bytes())
+        except (OSError, ValueError):
+            pass
+        
+        if index is None:
+            index = self._build_index()
+            self._write_index_snapshot(snapshot_path, index)
+        
+        self._index = index
+        self._index_sha = sha
+        return index
+    
+    def _build_index(self):
+        """Scan the repository and parse every course"""
+        courses = self._scan_course_list()
+        info = {}
+        mtimes = {}
+        for course_id in courses:
+            try:
+                mtimes[course_id] = list(self._source_mtimes(course_id))
+                info[course_id] = self._read_course_info(course_id)
+            except Exception:
+                # Broken courses are parsed live so the error is reported
+                mtimes.pop(course_id, None)
+        return {'courses': courses, 'info': info, 'mtimes': mtimes,
+                'courses_mtime': self._courses_dir_mtime()}
+    
+    def _write_index_snapshot(self, snapshot_path, index):
+        """Atomically write the index and drop this clone's older snapshots"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = snapshot_path.with_suffix('.tmp')
+            tmp_path.write_bytes(orjson.dumps(index))
+            os.replace(tmp_path, snapshot_path)
+            
+            for old_snapshot in self.cache_dir.glob(f'{self._snapshot_prefix}-*.json'):
+                if old_snapshot != snapshot_path:
+                    old_snapshot.unlink(missing_ok=True)
+        except OSError as e:
+            print(f"Error writing course index snapshot: {e}")
     
     def get_course_list(self):
         """Get list of all available courses"""
+        index = self._get_index()
+        # Course folders added or removed since HEAD change the directory mtime
+        if index is not None and index.get('courses_mtime') == self._courses_dir_mtime():
+            return list(index['courses'])
+        return self._scan_course_list()
+    
+    def _courses_dir_mtime(self):
+        """mtime of the courses directory, or None if it is missing"""
+        try:
+            return os.stat(self.courses_path).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _source_mtimes(self, course_id):
+        """mtimes of a course's course.yml and en.md; OSError if either is missing"""
+        course_dir = self.courses_path / course_id
+        return (os.stat(course_dir / 'course.yml').st_mtime_ns,
+                os.stat(course_dir / 'en.md').st_mtime_ns)
+    
+    def _scan_course_list(self):
+        """Walk the courses directory for folders with a course.yml"""
         if not self.courses_path.exists():
             return []
         
+        # scandir's entries know their type from the directory listing, so
+        # only the course.yml check costs a stat per course
         courses = []
-        for course_dir in self.courses_path.iterdir():
-            if course_dir.is_dir() and not course_dir.name.startswith('.'):
-                course_yml = course_dir / 'course.yml'
-                if course_yml.exists():
-                    courses.append(course_dir.name)
+        with os.scandir(self.courses_path) as entries:
+            for entry in entries:
+                if entry.is_dir() and not entry.name.startswith('.'):
+                    if os.path.isfile(os.path.join(entry.path, 'course.yml')):
+                        courses.append(entry.name)
         
         return sorted(courses)
     
     def get_course_info(self, course_id):
         """Extract course title from en.md and UUID from course.yml"""
+        try:
+            mtimes = self._source_mtimes(course_id)
+        except OSError:
+            # Missing files are reported by _read_course_info
+            return self._read_course_info(course_id)
+        
+        # The index holds HEAD's parse; files edited since then are re-read
+        index = self._get_index()
+        if (index is not None and course_id in index['info'] and
+                tuple(index.get('mtimes', {}).get(course_id, ())) == mtimes):
+            return dict(index['info'][course_id])
+        
+        # Outside the index (no git checkout, a course that failed to parse,
+        # or uncommitted edits) reuse the last parse until the files change
+        cached = self._info_cache.get(course_id)
+        if cached is not None and cached[0] == mtimes:
+            return dict(cached[1])
+        
+        info = self._read_course_info(course_id)
+        self._info_cache[course_id] = (mtimes, info)
+        return dict(info)
+    
+    def _read_course_info(self, course_id):
+        """Parse course.yml and en.md for a course"""
         course_yml_path = self.courses_path / course_id / 'course.yml'
         en_md_path = self.courses_path / course_id / 'en.md'
         
@@ -35,19 +194,23 @@ class CourseManager:
         
         # Get UUID from course.yml
         with open(course_yml_path, 'r', encoding='utf-8') as f:
-            course_data = yaml.safe_load(f)
+            course_data = yaml.load(f, Loader=_YamlLoader)
         
         # The id field in course.yml is the UUID
         uuid = course_data.get('id', '')
         if not uuid:
             raise ValueError(f"Missing id (UUID) in course.yml for {course_id}")
         
-        # Get title from en.md header
+        # Get title from en.md header: only the first non-blank line can
+        # hold it, so stop reading there instead of loading the whole file
+        title_match = None
         with open(en_md_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+            for line in f:
+                line = line.strip()
+                if line:
+                    title_match = _TITLE_RE.match(line)
+                    break
         
-        # Extract title from the first H1 header
-        title_match = re.match(r'^#+\s+(.+)$', content.strip(), re.MULTILINE)
         if title_match:
             title = title_match.group(1).strip()
         else:
@@ -56,8 +219,8 @@ class CourseManager:
         
         # Generate title slug for URL
         title_slug = title.lower()
-        title_slug = re.sub(r'[^\w\s-]', '', title_slug)
-        title_slug = re.sub(r'[-\s]+', '-', title_slug)
+        title_slug = _SLUG_STRIP_RE.sub('', title_slug)
+        title_slug = _SLUG_HYPHEN_RE.sub('-', title_slug)
         title_slug = title_slug.strip('-')
         
         return {
@@ -73,8 +236,8 @@ class CourseManager:
         clean_title = course_title.lower()
         
         # Replace special characters and spaces with hyphens
-        clean_title = re.sub(r'[^\w\s-]', '', clean_title)
-        clean_title = re.sub(r'[-\s]+', '-', clean_title)
+        clean_title = _SLUG_STRIP_RE.sub('', clean_title)
+        clean_title = _SLUG_HYPHEN_RE.sub('-', clean_title)
         clean_title = clean_title.strip('-')
         
         return f"https://planb.network/{lang}/courses/{clean_title}-{uuid}"
@@ -111,18 +274,24 @@ class CourseManager:
         if not lang_file.exists():
             return "medium"  # Default size
         
+        # UTF-8 takes 1-4 bytes per character, so the file size bounds the
+        # character count; only read the file when the bounds straddle a
+        # threshold (non-Latin scripts near a boundary)
+        byte_count = lang_file.stat().st_size
+        size = self._size_bucket(byte_count)
+        if size == self._size_bucket(byte_count // 4):
+            return size
+        
         with open(lang_file, 'r', encoding='utf-8') as f:
             content = f.read()
         
         # Estimate based on character count
-        char_count = len(content)
-        
-        if char_count < 10000:
-            return "small"
-        elif char_count < 50000:
-            return "medium"
-        else:
-            return "large"
+        return self._size_bucket(len(content))
+    
+    @staticmethod
+    def _size_bucket(char_count):
+        """Map a character count to a course size"""
+        return COURSE_SIZE_NAMES[bisect_right(COURSE_SIZE_THRESHOLDS, char_count)]
     
     def validate_course_structure(self, course_id):
         """Validate that course has proper structure"""
@@ -1,14 +1,89 @@
-from github import Github, GithubException
+from github import Auth, Github, GithubException
+import os
+import time
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from pathlib import Path
 from config import Config
 
+# Selection on a ProjectV2 node that yields its fields and select options
+PROJECT_FIELDS_SELECTION = """
+            ... on ProjectV2 {
+              fields(first: 20) {
+                nodes {
+                  ... on ProjectV2Field {
+                    id
+                    name
+                  }
+                  ... on ProjectV2SingleSelectField {
+                    id
+                    name
+                    options {
+                      id
+                      name
+                    }
+                  }
+                }
+              }
+            }"""
+
 class GitHubIntegration:
-    def __init__(self, token):
-        self.github = Github(token)
+    # How long node ids read from disk are trusted (seconds); labels not
+    # in the map are looked up on demand, and restored project field maps
+    # are refetched when a field or option misses or an update fails
+    NODE_IDS_SNAPSHOT_TTL = 24 * 60 * 60
+    
+    def __init__(self, token, cache_dir=None):
+        # Instances are cached per token, so PyGithub's urllib3 pool is kept
+        # alive across requests; size it for the background issue workers
+        self.github = Github(auth=Auth.Token(token), pool_size=10)
         self.token = token
         self.repo = None
+        # Shared session so GraphQL/REST calls reuse pooled connections
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+        # Every GraphQL/REST call here authenticates with the same token
+        self._session.headers.update({'Authorization': f'Bearer {token}'})
+        self._project_field_maps = {}
+        # (repository node id, {label name: label node id}) for GraphQL creates
+        self._repo_node_ids = None
+        # Node ids and field maps survive restarts so a cold create skips
+        # the metadata query
+        self._snapshot_path = Path(cache_dir or Config.CACHE_DIR) / 'github-node-ids.json'
+        self._load_node_ids_snapshot()
         self._init_repo()
     
+    def _load_node_ids_snapshot(self):
+        """Restore repository/label ids and project field maps from disk"""
+        try:
+            snapshot = orjson.loads(self._snapshot_path.read_bytes())
+            if time.time() - snapshot['written_at'] > self.NODE_IDS_SNAPSHOT_TTL:
+                return
+            repo_node_ids = snapshot['repository']
+            project_field_maps = snapshot['projects']
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        
+        if repo_node_ids is not None:
+            self._repo_node_ids = tuple(repo_node_ids)
+        self._project_field_maps.update(project_field_maps)
+    
+    def _write_node_ids_snapshot(self):
+        """Atomically write the memoized node ids and field maps"""
+        snapshot = {
+            'written_at': time.time(),
+            'repository': self._repo_node_ids,
+            'projects': self._project_field_maps
+        }
+        try:
+            self._snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._snapshot_path.with_suffix('.tmp')
+            tmp_path.write_bytes(orjson.dumps(snapshot))
+            os.replace(tmp_path, self._snapshot_path)
+        except OSError as e:
+            print(f"Error writing GitHub node id snapshot: {e}")
+    
     def _init_repo(self):
         """Initialize repository object"""
         try:
@@ -18,6 +93,9 @@ class GitHubIntegration:
     
     def create_issue(self, title, body, labels):
         """Create a new issue in the repository"""
+        if self.repo is None:
+            # Instances are long-lived, so retry a failed initialization
+            self._init_repo()
         try:
             issue = self.repo.create_issue(
                 title=title,
@@ -28,25 +106,137 @@ class GitHubIntegration:
         except GithubException as e:
             raise Exception(f"Failed to create issue: {e.data}")
     
-    def link_to_project(self, issue, project_id, fields):
-        """Link issue to project and set custom fields"""
-        # GraphQL query to add issue to project
-        add_to_project_mutation = """
-        mutation($projectId: ID!, $contentId: ID!) {
-          addProjectV2ItemById(input: {projectId: $projectId, contentId: $contentId}) {
-            item {
+    def _get_repo_node_ids(self, labels, project_id=None):
+        """Get the repository node id and the ids of the given labels, memoized
+
+        Only labels not seen before are looked up, by name, so repositories
+        with many labels don't need paging. Labels that don't exist are
+        left out of the returned map. When project_id's field map isn't
+        known yet it is fetched in the same query, so a cold create doesn't
+        pay a separate round trip.
+        """
+        repository_id, label_ids = self._repo_node_ids or (None, {})
+        missing = [label for label in dict.fromkeys(labels) if label not in label_ids]
+        need_fields = project_id is not None and project_id not in self._project_field_maps
+        if repository_id is not None and not missing and not need_fields:
+            return repository_id, label_ids
+        
+        variable_defs = ['$owner: String!', '$name: String!']
+        variables = {'owner': Config.GITHUB_OWNER, 'name': Config.GITHUB_REPO}
+        label_fields = []
+        for i, label in enumerate(missing):
+            variable_defs.append(f'$l{i}: String!')
+            label_fields.append(f'l{i}: label(name: $l{i}) {{ id }}')
+            variables[f'l{i}'] = label
+        
+        project_selection = ''
+        if need_fields:
+            variable_defs.append('$projectId: ID!')
+            variables['projectId'] = project_id
+            project_selection = f"project: node(id: $projectId) {{{PROJECT_FIELDS_SELECTION}\n          }}"
+        
+        repo_query = f"""
+        query({', '.join(variable_defs)}) {{
+          repository(owner: $owner, name: $name) {{
+            id
+            {' '.join(label_fields)}
+          }}
+          {project_selection}
+        }}
+        """
+        
+        response = self._session.post(
+            'https://api.github.com/graphql',
+            json={'query': repo_query, 'variables': variables},
+            timeout=10
+        )
+        
+        if response.status_code != 200:
+            raise Exception(f"Failed to get repository labels: {response.text}")
+        
+        result = response.json()
+        if 'errors' in result:
+            raise Exception(f"GraphQL errors: {result['errors']}")
+        
+        if need_fields:
+            self._store_project_field_map(project_id, result['data']['project'])
+        
+        repository = result['data']['repository']
+        label_ids = dict(label_ids)
+        for i, label in enumerate(missing):
+            found = repository.get(f'l{i}')
+            if found is not None:
+                label_ids[label] = found['id']
+        self._repo_node_ids = (repository['id'], label_ids)
+        self._write_node_ids_snapshot()
+        return self._repo_node_ids
+    
+    def create_issue_and_link(self, title, body, labels, project_id, fields):
+        """Create an issue already attached to the project, then set its fields
+
+        createIssue takes the project id directly, so creating and linking is
+        one GraphQL request instead of a REST create plus a GraphQL add.
+        Returns {'number', 'url'}.
+        """
+        repository_id, label_ids = self._get_repo_node_ids(labels, project_id)
+        if any(label not in label_ids for label in labels):
+            # GraphQL can't create labels on the fly the way REST does
+            issue = self.create_issue(title, body, labels)
+            self.link_to_project(issue, project_id, fields)
+            return {'number': issue.number, 'url': self.get_issue_url(issue)}
+        
+        create_issue_mutation = """
+        mutation($repositoryId: ID!, $title: String!, $body: String, $labelIds: [ID!], $projectIds: [ID!]) {
+          createIssue(input: {repositoryId: $repositoryId, title: $title, body: $body, labelIds: $labelIds, projectV2Ids: $projectIds}) {
+            issue {
               id
+              number
+              url
+              projectItems(first: 10) {
+                nodes {
+                  id
+                  project {
+                    id
+                  }
+                }
+              }
             }
           }
         }
         """
         
-        # Execute mutation to add issue to project
-        headers = {
-            'Authorization': f'Bearer {self.token}',
-            'Content-Type': 'application/json',
+        variables = {
+            'repositoryId': repository_id,
+            'title': title,
+            'body': body,
+            'labelIds': [label_ids[label] for label in labels],
+            'projectIds': [project_id]
         }
         
+        response = self._session.post(
+            'https://api.github.com/graphql',
+            json={'query': create_issue_mutation, 'variables': variables},
+            timeout=10
+        )
+        
+        if response.status_code != 200:
+            raise Exception(f"Failed to create issue: {response.text}")
+        
+        result = response.json()
+        if 'errors' in result:
+            raise Exception(f"Failed to create issue: {result['errors']}")
+        
+        issue = result['data']['createIssue']['issue']
+        item_id = next((item['id'] for item in issue['projectItems']['nodes']
+                        if item['project']['id'] == project_id), None)
+        if item_id is None:
+            item_id = self._add_to_project(issue['id'], project_id)
+        
+        self._set_project_fields(item_id, project_id, fields)
+        return {'number': issue['number'], 'url': issue['url']}
+    
+    def link_to_project(self, issue, project_id, fields):
+        """Link issue to project and set custom fields"""
         # Get the node_id from the issue
         # PyGithub v2+ uses node_id as a direct attribute
         node_id = None
@@ -60,12 +250,9 @@ class GitHubIntegration:
             node_id = issue.raw_data['node_id']
         else:
             # As a last resort, make a REST API call to get the issue with node_id
-            headers = {
-                'Authorization': f'Bearer {self.token}',
-                'Accept': 'application/vnd.github.v3+json'
-            }
+            headers = {'Accept': 'application/vnd.github.v3+json'}
             api_url = f"https://api.github.com/repos/{Config.GITHUB_OWNER}/{Config.GITHUB_REPO}/issues/{issue.number}"
-            resp = requests.get(api_url, headers=headers)
+            resp = self._session.get(api_url, headers=headers, timeout=10)
             if resp.status_code == 200:
                 issue_data = resp.json()
                 node_id = issue_data.get('node_id')
@@ -73,15 +260,35 @@ class GitHubIntegration:
         if not node_id:
             raise Exception(f"Unable to get node_id from issue #{issue.number}")
         
+        item_id = self._add_to_project(node_id, project_id)
+        
+        # Now set the custom fields
+        self._set_project_fields(item_id, project_id, fields)
+        
+        return True
+    
+    def _add_to_project(self, node_id, project_id):
+        """Add an issue (by node id) to a project and return the item id"""
+        # GraphQL query to add issue to project
+        add_to_project_mutation = """
+        mutation($projectId: ID!, $contentId: ID!) {
+          addProjectV2ItemById(input: {projectId: $projectId, contentId: $contentId}) {
+            item {
+              id
+            }
+          }
+        }
+        """
+        
         variables = {
             'projectId': project_id,
             'contentId': node_id
         }
         
-        response = requests.post(
+        response = self._session.post(
             'https://api.github.com/graphql',
             json={'query': add_to_project_mutation, 'variables': variables},
-            headers=headers
+            timeout=10
         )
         
         if response.status_code != 200:
@@ -92,50 +299,24 @@ class GitHubIntegration:
             raise Exception(f"GraphQL errors: {result['errors']}")
         
         # Get the project item ID
-        item_id = result['data']['addProjectV2ItemById']['item']['id']
-        
-        # Now set the custom fields
-        self._set_project_fields(item_id, project_id, fields)
-        
-        return True
+        return result['data']['addProjectV2ItemById']['item']['id']
     
-    def _set_project_fields(self, item_id, project_id, fields):
-        """Set custom fields on a project item"""
-        # First, get the project fields
-        get_fields_query = """
-        query($projectId: ID!) {
-          node(id: $projectId) {
-            ... on ProjectV2 {
-              fields(first: 20) {
-                nodes {
-                  ... on ProjectV2Field {
-                    id
-                    name
-                  }
-                  ... on ProjectV2SingleSelectField {
-                    id
-                    name
-                    options {
-                      id
-                      name
-                    }
-                  }
-                }
-              }
-            }
-          }
-        }
-        """
+    def _get_project_field_map(self, project_id, refresh=False):
+        """Get {field name: {'id', 'options'}} for a project, memoized per project"""
+        if not refresh and project_id in self._project_field_maps:
+            return self._project_field_maps[project_id]
         
-        headers = {
-            'Authorization': f'Bearer {self.token}',
-            'Content-Type': 'application/json',
-        }
+        get_fields_query = f"""
+        query($projectId: ID!) {{
+          node(id: $projectId) {{{PROJECT_FIELDS_SELECTION}
+          }}
+        }}
+        """
         
-        response = requests.post(
+        response = self._session.post(
             'https://api.github.com/graphql',
             json={'query': get_fields_query, 'variables': {'projectId': project_id}},
-            headers=headers
+            timeout=10
         )
         
         if response.status_code != 200:
@@ -145,9 +326,15 @@ class GitHubIntegration:
         if 'errors' in result:
             raise Exception(f"GraphQL errors: {result['errors']}")
         
+        field_map = self._store_project_field_map(project_id, result['data']['node'])
+        self._write_node_ids_snapshot()
+        return field_map
+    
+    def _store_project_field_map(self, project_id, project):
+        """Parse a ProjectV2 node's fields and memoize them for project_id"""
         # Parse fields
         field_map = {}
-        for field in result['data']['node']['fields']['nodes']:
+        for field in project['fields']['nodes']:
             field_name = field['name']
             field_id = field['id']
             
@@ -158,24 +345,80 @@ class GitHubIntegration:
             else:
                 field_map[field_name] = {'id': field_id}
         
-        # Update each field
-        update_field_mutation = """
-        mutation($projectId: ID!, $itemId: ID!, $fieldId: ID!, $value: ProjectV2FieldValue!) {
-          updateProjectV2ItemFieldValue(
-            input: {
-              projectId: $projectId
-              itemId: $itemId
-              fieldId: $fieldId
-              value: $value
-            }
-          ) {
-            projectV2Item {
-              id
-            }
-          }
+        # Project fields rarely change, so keep them for the lifetime of this
+        # instance; _set_project_fields refetches when a lookup misses
+        self._project_field_maps[project_id] = field_map
+        return field_map
+    
+    def _set_project_fields(self, item_id, project_id, fields):
+        """Set custom fields on a project item"""
+        field_map = self._get_project_field_map(project_id)
+        updates, warnings = self._resolve_field_updates(field_map, fields)
+        refreshed = bool(warnings)
+        if refreshed:
+            # A field or option added/renamed since the map was fetched
+            field_map = self._get_project_field_map(project_id, refresh=True)
+            updates, warnings = self._resolve_field_updates(field_map, fields)
+            for warning in warnings:
+                print(warning)
+        
+        if not updates:
+            return
+        
+        error = self._send_field_updates(item_id, project_id, updates)
+        if error and not refreshed:
+            # A map restored from the snapshot can hold ids of fields or
+            # options deleted since; retry once with a fresh map
+            field_map = self._get_project_field_map(project_id, refresh=True)
+            updates, warnings = self._resolve_field_updates(field_map, fields)
+            for warning in warnings:
+                print(warning)
+            error = self._send_field_updates(item_id, project_id, updates) if updates else None
+        
+        if error:
+            print(error)
+    
+    def _send_field_updates(self, item_id, project_id, updates):
+        """Apply [(field name, field id, value)] to an item; an error message or None"""
+        # Send all field updates as aliased mutations in a single request
+        variable_defs = ['$projectId: ID!', '$itemId: ID!']
+        mutations = []
+        variables = {
+            'projectId': project_id,
+            'itemId': item_id
         }
-        """
+        for i, (field_name, field_id, value) in enumerate(updates):
+            variable_defs.append(f'$fieldId{i}: ID!')
+            variable_defs.append(f'$value{i}: ProjectV2FieldValue!')
+            mutations.append(
+                f"f{i}: updateProjectV2ItemFieldValue(input: {{projectId: $projectId, itemId: $itemId, "
+                f"fieldId: $fieldId{i}, value: $value{i}}}) {{ projectV2Item {{ id }} }}"
+            )
+            variables[f'fieldId{i}'] = field_id
+            variables[f'value{i}'] = value
+        
+        update_fields_mutation = f"mutation({', '.join(variable_defs)}) {{\n  " + '\n  '.join(mutations) + "\n}"
+        
+        response = self._session.post(
+            'https://api.github.com/graphql',
+            json={'query': update_fields_mutation, 'variables': variables},
+            timeout=10
+        )
+        
+        field_names = ', '.join(field_name for field_name, _, _ in updates)
+        if response.status_code != 200:
+            return f"Failed to update fields '{field_names}': {response.text}"
         
+        result = response.json()
+        if 'errors' in result:
+            return f"Errors updating fields '{field_names}': {result['errors']}"
+        return None
+    
+    @staticmethod
+    def _resolve_field_updates(field_map, fields):
+        """Resolve fields to [(field name, field id, value)] plus warnings for misses"""
+        updates = []
+        warnings = []
         for field_name, field_value in fields.items():
             # Try alternative field names if the exact match isn't found
             actual_field_name = field_name
@@ -196,7 +439,7 @@ class GitHubIntegration:
                             break
                 
                 if not found:
-                    print(f"Warning: Field '{field_name}' not found in project")
+                    warnings.append(f"Warning: Field '{field_name}' not found in project")
                     continue
             
             field_info = field_map[actual_field_name]
@@ -208,27 +451,15 @@ class GitHubIntegration:
                 if field_value in field_info['options']:
                     value = {'singleSelectOptionId': field_info['options'][field_value]}
                 else:
-                    print(f"Warning: Option '{field_value}' not found for field '{field_name}'")
+                    warnings.append(f"Warning: Option '{field_value}' not found for field '{field_name}'")
                     continue
             else:
                 # Text field
                 value = {'text': str(field_value)}
             
-            variables = {
-                'projectId': project_id,
-                'itemId': item_id,
-                'fieldId': field_id,
-                'value': value
-            }
-            
-            response = requests.post(
-                'https://api.github.com/graphql',
-                json={'query': update_field_mutation, 'variables': variables},
-                headers=headers
-            )
-            
-            if response.status_code != 200:
-                print(f"Failed to update field '{field_name}': {response.text}")
+            updates.append((field_name, field_id, value))
+        
+        return updates, warnings
     
     def get_issue_url(self, issue):
         """Get the HTML URL of an issue"""
@@ -0,0 +1,104 @@
+import hashlib
+
+import orjson
+
+# Response bodies are precomputed for queries up to this length
+PRECOMPUTED_QUERY_LENGTH = 2
+
+class LanguageIndex:
+    """Searchable list of languages for the autocomplete endpoints
+
+    Ranking matches the original scoring ladder: exact code match, code
+    prefix, name prefix, substring of the name, then substring anywhere in
+    "name code". Ties keep the original list order.
+    """
+
+    def __init__(self, languages):
+        """Build the index from (code, name) pairs"""
+        self.entries = []
+        self._lowered = []
+        self._exact_code = {}
+        self._by_code_prefix = {}
+        self._by_name_prefix = {}
+
+        for i, (code, name) in enumerate(languages):
+            code_lower = code.lower()
+            name_lower = name.lower()
+            self.entries.append({
+                'code': code,
+                'name': name,
+                'display': f"{name} ({code})",
+                'searchText': f"{name_lower} {code_lower}"
+            })
+            self._lowered.append((code_lower, name_lower))
+
+            self._exact_code.setdefault(code_lower, []).append(i)
+            for length in range(1, len(code_lower) + 1):
+                self._by_code_prefix.setdefault(code_lower[:length], []).append(i)
+            for length in range(1, len(name_lower) + 1):
+                self._by_name_prefix.setdefault(name_lower[:length], []).append(i)
+
+        # Autocomplete mostly sends 1-2 character queries, so their response
+        # bodies are serialized once here. Every short query with results is a
+        # substring of some searchText; anything else gets the empty response.
+        short_queries = {''}
+        for entry in self.entries:
+            text = entry['searchText']
+            for length in range(1, PRECOMPUTED_QUERY_LENGTH + 1):
+                short_queries.update(text[j:j + length] for j in range(len(text) - length + 1))
+        self._payloads = {query: self._serialize(self.search(query)) for query in short_queries}
+
+        # Identifies this language list in ETags; responses for a given URL
+        # only change when the list does
+        self.all_payload = self._serialize(self.entries)
+        self.etag = hashlib.blake2b(self.all_payload, digest_size=8).hexdigest()
+
+    def search(self, query, limit=10):
+        """Return up to limit entries matching query, best matches first"""
+        query = query.lower()
+        if not query:
+            return self.entries[:limit]
+
+        results = []
+        seen = set()
+
+        def take(indices):
+            # Append unseen entries in order; True once the limit is reached
+            for i in indices:
+                if i not in seen:
+                    seen.add(i)
+                    results.append(self.entries[i])
+                    if len(results) >= limit:
+                        return True
+            return False
+
+        # Prefix matches are direct lookups
+        if (take(self._exact_code.get(query, ())) or
+                take(self._by_code_prefix.get(query, ())) or
+                take(self._by_name_prefix.get(query, ()))):
+            return results
+
+        # Only substring matches need a scan
+        in_name = []
+        elsewhere = []
+        for i, (entry, (code_lower, name_lower)) in enumerate(zip(self.entries, self._lowered)):
+            if i in seen:
+                continue
+            if query in name_lower:
+                in_name.append(i)
+            elif query in entry['searchText']:
+                elsewhere.append(i)
+
+        take(in_name) or take(elsewhere)
+        return results
+
+    def search_payload(self, query, limit=10):
+        """Return the JSON body ({"languages": [...]}) for a search, as bytes"""
+        query = query.lower()
+        if limit == 10 and len(query) <= PRECOMPUTED_QUERY_LENGTH:
+            return self._payloads.get(query) or self._serialize([])
+        return self._serialize(self.search(query, limit))
+
+    @staticmethod
+    def _serialize(languages):
+        return orjson.dumps({'languages': languages}, option=orjson.OPT_APPEND_NEWLINE)
@@ -0,0 +1,40 @@
+import threading
+import time
+
+class RateLimiter:
+    """Thread-safe fixed-window request limiter, counted per key (e.g. client IP)"""
+
+    def __init__(self, limit, window_seconds=60):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._windows = {}
+        self._lock = threading.Lock()
+
+    def hit(self, key):
+        """Count a request for key
+
+        Returns 0 if the request is allowed, otherwise the number of seconds
+        until the key's window resets.
+        """
+        now = time.monotonic()
+        with self._lock:
+            window_start, count = self._windows.get(key, (now, 0))
+            if now - window_start >= self.window_seconds:
+                window_start, count = now, 0
+
+            count += 1
+            self._windows[key] = (window_start, count)
+
+            # Keep the table small; expired windows would be reset anyway
+            if len(self._windows) > 1024:
+                self._prune(now)
+
+            if count > self.limit:
+                return self.window_seconds - (now - window_start)
+            return 0
+
+    def _prune(self, now):
+        expired = [key for key, (start, _) in self._windows.items()
+                   if now - start >= self.window_seconds]
+        for key in expired:
+            del self._windows[key]
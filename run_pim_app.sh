@@ -217,5 +217,12 @@ echo ""
 # Wait a moment for the server to start, then open browser
 (sleep 2 && open_browser "http://localhost:5000") &
 
-# Run the Flask app
-python3 app.py
\ No newline at end of file
+# Run the app
+if [ "$PIM_DEV" = "1" ]; then
+    # Flask development server with debugger and auto-reload
+    python3 app.py
+else
+    # Single worker (configuration changes are held in process memory),
+    # threaded so slow GitHub calls don't block other requests
+    gunicorn -k gthread -w 1 --threads 8 --timeout 120 -b 127.0.0.1:5000 wsgi:application
+fi
\ No newline at end of file
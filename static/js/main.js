@@ -28,6 +28,23 @@ async function apiCall(url, options = {}) {
     }
 }
 
+// Poll a background issue creation job until it finishes
+async function waitForIssueJob(jobId, interval = 1000) {
+    while (true) {
+        const response = await fetch(`/api/jobs/${encodeURIComponent(jobId)}`);
+        const result = await response.json();
+        
+        if (!response.ok) {
+            throw new Error(result.error || 'Issue creation failed');
+        }
+        if (result.status === 'done') {
+            return result;
+        }
+        
+        await new Promise(resolve => setTimeout(resolve, interval));
+    }
+}
+
 // Form validation
 function validateForm(formId) {
     const form = document.getElementById(formId);
@@ -0,0 +1,187 @@
+import pytest
+
+import cache_service
+import rate_limiter
+from cache_service import CacheService
+from language_index import LanguageIndex
+from rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache_service.time, 'monotonic', fake)
+    monkeypatch.setattr(rate_limiter.time, 'monotonic', fake)
+    return fake
+
+
+def shard_sizes(cache):
+    """Total (entries, heap items) across all shards"""
+    return (sum(len(entries) for entries, _, _ in cache._shards),
+            sum(len(heap) for _, heap, _ in cache._shards))
+
+
+def test_cache_entries_expire(clock):
+    cache = CacheService(default_ttl=10)
+    cache.set('a', 1)
+    cache.set('b', 2, ttl_seconds=30)
+
+    clock.now += 10
+    assert cache.get('a') == 1
+    clock.now += 1
+    assert cache.get('a') is None
+    assert cache.get('a', 'missing') == 'missing'
+    assert cache.get('b') == 2
+
+
+def test_cache_set_evicts_expired_entries_never_read_again(clock):
+    cache = CacheService()
+    for i in range(50):
+        cache.set(('short', i), i, ttl_seconds=1)
+    cache.set('long', 'kept', ttl_seconds=100)
+
+    clock.now += 2
+    # Each set only drops expired entries of its own shard
+    for i in range(CacheService.SHARD_COUNT * 4):
+        cache.set(('new', i), i, ttl_seconds=100)
+
+    entries, heap_items = shard_sizes(cache)
+    assert entries == CacheService.SHARD_COUNT * 4 + 1
+    assert heap_items == entries
+    assert cache.get('long') == 'kept'
+
+
+def test_cache_overwrite_keeps_the_newer_deadline(clock):
+    cache = CacheService()
+    cache.set('key', 'old', ttl_seconds=1)
+    cache.set('key', 'new', ttl_seconds=100)
+
+    clock.now += 2
+    # Popping the stale heap item must not drop the live entry
+    entries, heap, _ = cache._shard('key')
+    cache._evict_expired(entries, heap, clock.now)
+    assert cache.get('key') == 'new'
+    assert len(heap) == 1
+
+
+def test_cache_heap_is_compacted_after_overwrites(clock):
+    cache = CacheService()
+    for i in range(1000):
+        cache.set('key', i, ttl_seconds=100)
+
+    _, heap, _ = cache._shard('key')
+    entries, _ = shard_sizes(cache)
+    assert entries == 1
+    assert len(heap) <= 2 * entries + CacheService.SHARD_COUNT
+    assert cache.get('key') == 999
+
+
+def test_cache_clear_empties_entries_and_heaps(clock):
+    cache = CacheService()
+    for i in range(20):
+        cache.set(i, i)
+    cache.clear()
+    assert shard_sizes(cache) == (0, 0)
+
+
+def test_get_or_set_computes_only_on_a_miss(clock):
+    cache = CacheService()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    assert cache.get_or_set('key', compute, ttl_seconds=5) == 1
+    assert cache.get_or_set('key', compute, ttl_seconds=5) == 1
+    assert len(calls) == 1
+
+    clock.now += 6
+    assert cache.get_or_set('key', compute, ttl_seconds=5) == 2
+    assert len(calls) == 2
+
+
+def test_rate_limiter_rejects_over_the_limit_until_the_window_resets(clock):
+    limiter = RateLimiter(limit=3, window_seconds=60)
+    assert [limiter.hit('client') for _ in range(3)] == [0, 0, 0]
+
+    clock.now += 20
+    assert limiter.hit('client') == 40
+    # Other clients have their own window
+    assert limiter.hit('other') == 0
+
+    clock.now += 40
+    assert limiter.hit('client') == 0
+
+
+def old_language_search(languages, query, limit=10):
+    """The linear scorer LanguageIndex replaced, kept as the reference"""
+    entries = [
+        {
+            'code': code,
+            'name': name,
+            'display': f"{name} ({code})",
+            'searchText': f"{name.lower()} {code.lower()}"
+        }
+        for code, name in languages
+    ]
+    query = query.lower()
+    if not query:
+        return entries[:limit]
+
+    results = []
+    for entry in entries:
+        code_lower = entry['code'].lower()
+        name_lower = entry['name'].lower()
+        if query in entry['searchText']:
+            if code_lower == query:
+                score = 100
+            elif code_lower.startswith(query):
+                score = 90
+            elif name_lower.startswith(query):
+                score = 80
+            elif query in name_lower:
+                score = 70
+            else:
+                score = 60
+            results.append((entry, score))
+
+    results.sort(key=lambda result: result[1], reverse=True)
+    return [entry for entry, _ in results[:limit]]
+
+
+LANGUAGES = [
+    ('en', 'English'), ('es', 'Spanish'), ('es-419', 'Spanish (Latin America)'),
+    ('fr', 'French'), ('de', 'German'), ('it', 'Italian'), ('pt', 'Portuguese'),
+    ('pt-BR', 'Portuguese (Brazil)'), ('nl', 'Dutch'), ('sv', 'Swedish'),
+    ('fi', 'Finnish'), ('ja', 'Japanese'), ('zh-Hans', 'Chinese (Simplified)'),
+    ('zh-Hant', 'Chinese (Traditional)'), ('ko', 'Korean'), ('ru', 'Russian'),
+    ('cs', 'Czech'), ('et', 'Estonian'), ('sw', 'Swahili'), ('si', 'Sinhala'),
+    ('id', 'Indonesian'), ('nb-NO', 'Norwegian Bokmål'), ('vi', 'Vietnamese'),
+]
+
+
+@pytest.mark.parametrize('query', [
+    '', 'e', 'es', 'ES', 'en', 'sh', 'ish', 'pt', 'pt-', 'Port', 'an', 'n',
+    'zh', 'hans', 'ese', 'i', 'si', 'sw', 'xyz', 'é', ' (', 'bokm',
+])
+def test_language_index_ranks_like_the_linear_scorer(query):
+    index = LanguageIndex(LANGUAGES)
+    assert index.search(query) == old_language_search(LANGUAGES, query)
+    assert index.search(query, limit=3) == old_language_search(LANGUAGES, query, limit=3)
+
+
+def test_language_index_precomputed_payloads_match_search():
+    index = LanguageIndex(LANGUAGES)
+    for query in ['', 'e', 'es', 'Zh', 'qq', 'ese']:
+        assert index.search_payload(query) == index._serialize(index.search(query))
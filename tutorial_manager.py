@@ -1,8 +1,21 @@
+import heapq
 import os
 import yaml
 from pathlib import Path
 import re
-from fuzzywuzzy import fuzz, process
+from rapidfuzz import fuzz
+
+# libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Title heading and slug patterns, compiled once
+_FRONTMATTER_TITLE_RE = re.compile(r'^---[\s\S]*?---\s*#+\s+(.+)$', re.MULTILINE)
+_TITLE_RE = re.compile(r'^#+\s+(.+)$', re.MULTILINE)
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_HYPHEN_RE = re.compile(r'[-\s]+')
 
 class TutorialManager:
     def __init__(self, repo_path):
@@ -44,9 +57,10 @@ class TutorialManager:
         
         return sorted(tutorials, key=lambda x: x['path'])
     
-    def search_tutorials(self, query, limit=10):
+    def search_tutorials(self, query, limit=10, tutorials=None):
         """Fuzzy search tutorials by name or category"""
-        tutorials = self.get_tutorials_list()
+        if tutorials is None:
+            tutorials = self.get_tutorials_list()
         
         if not query:
             return tutorials[:limit]
@@ -72,9 +86,9 @@ class TutorialManager:
             if best_score > 50:  # Threshold for relevance
                 results.append((tutorial, best_score))
         
-        # Sort by score and return top results
-        results.sort(key=lambda x: x[1], reverse=True)
-        return [result[0] for result in results[:limit]]
+        # Return top results by score (ties keep list order)
+        top = heapq.nlargest(limit, results, key=lambda x: x[1])
+        return [result[0] for result in top]
     
     def get_tutorial_info(self, category, tutorial_name):
         """Extract tutorial info from tutorial.yml and en.md"""
@@ -90,7 +104,7 @@ class TutorialManager:
         
         # Get ID from tutorial.yml
         with open(tutorial_yml_path, 'r', encoding='utf-8') as f:
-            tutorial_data = yaml.safe_load(f)
+            tutorial_data = yaml.load(f, Loader=_YamlLoader)
         
         tutorial_id = tutorial_data.get('id', '')
         if not tutorial_id:
@@ -101,10 +115,11 @@ class TutorialManager:
             content = f.read()
         
         # Extract title from the first H1 header
-        title_match = re.match(r'^---[\s\S]*?---\s*#+\s+(.+)$', content.strip(), re.MULTILINE)
+        content = content.strip()
+        title_match = _FRONTMATTER_TITLE_RE.match(content)
         if not title_match:
             # Try without frontmatter
-            title_match = re.match(r'^#+\s+(.+)$', content.strip(), re.MULTILINE)
+            title_match = _TITLE_RE.match(content)
         
         if title_match:
             title = title_match.group(1).strip()
@@ -125,8 +140,8 @@ class TutorialManager:
         clean_title = title.lower()
         
         # Replace special characters and spaces with hyphens
-        clean_title = re.sub(r'[^\w\s-]', '', clean_title)
-        clean_title = re.sub(r'[-\s]+', '-', clean_title)
+        clean_title = _SLUG_STRIP_RE.sub('', clean_title)
+        clean_title = _SLUG_HYPHEN_RE.sub('-', clean_title)
         clean_title = clean_title.strip('-')
         
         # Build URL: /tutorials/{category}/{tutorial_name}/{title-slug}-{uuid}
@@ -0,0 +1,9 @@
+"""
+WSGI entry point for running the app under a production server, e.g.:
+
+    gunicorn -k gthread -w 1 --threads 8 -b 127.0.0.1:5000 wsgi:application
+"""
+
+from app import app
+
+application = app